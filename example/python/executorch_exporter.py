@@ -8,18 +8,130 @@
 # to ExecuTorch format with automatic backend optimization selection.
 
 import argparse
+import copy
+import hashlib
 import json
+import multiprocessing
 import os
+import shutil
+import tempfile
+import time
 import warnings
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from importlib import metadata
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
 import torch
 import torch.nn as nn
 from torch.export import export
 
 # ExecuTorch imports
-from executorch.exir import to_edge, EdgeCompileConfig, to_edge_transform_and_lower
+from executorch.exir import EdgeCompileConfig, to_edge_transform_and_lower
+
+
+def _package_version(name: str) -> str:
+    """Return the installed version of a distribution, or "unknown"."""
+    try:
+        return metadata.version(name)
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _state_dict_digest(model: nn.Module) -> str:
+    """Hash a model's parameters and buffers to identify the exported weights."""
+    digest = hashlib.sha256()
+    for name, tensor in model.state_dict().items():
+        tensor = tensor.detach().cpu().reshape(-1).contiguous()
+        digest.update(f"{name}:{tensor.dtype}:{tensor.numel()}".encode())
+        digest.update(tensor.view(torch.uint8).numpy())
+    return digest.hexdigest()
+
+
+# Half precisions: weights and inputs are cast to these dtypes before tracing
+HALF_PRECISION_DTYPES = {"fp16": torch.float16, "bf16": torch.bfloat16}
+
+
+def _to_channels_last(inputs: Tuple) -> Tuple:
+    """Return ``inputs`` with every 4-D tensor in channels_last (NHWC) memory format."""
+    return tuple(
+        t.contiguous(memory_format=torch.channels_last)
+        if isinstance(t, torch.Tensor) and t.dim() == 4 else t
+        for t in inputs
+    )
+
+
+def _dynamic_batch(
+    sample_inputs: Tuple, max_batch_size: int
+) -> Tuple[Tuple, Tuple[Optional[Dict[int, Any]], ...]]:
+    """Trace inputs and ``dynamic_shapes`` marking dim 0 of every tensor input as the batch.
+
+    torch.export specializes size-1 dims, so the inputs are traced at batch 2.
+    """
+    from torch.export import Dim
+
+    batch = Dim("batch", min=1, max=max_batch_size)
+    trace_inputs = tuple(
+        torch.cat([t, t]) if isinstance(t, torch.Tensor) else t for t in sample_inputs
+    )
+    dynamic_shapes = tuple({0: batch} if isinstance(t, torch.Tensor) else None for t in sample_inputs)
+    return trace_inputs, dynamic_shapes
+
+
+_WRITE_CHUNK_BYTES = 64 << 20
+
+# ExecuTorch programs are flatbuffers with an "ET.." file identifier at bytes 4-8
+_PTE_IDENTIFIER_OFFSET = 4
+_PTE_IDENTIFIER_PREFIX = b"ET"
+
+
+def _is_pte_file(path: Union[str, Path]) -> bool:
+    """Cheap sanity check that ``path`` holds a complete-looking ExecuTorch program.
+
+    Catches empty, truncated or foreign files (e.g. a cache entry cut short by a
+    full disk) by reading only the flatbuffer header.
+    """
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_PTE_IDENTIFIER_OFFSET + len(_PTE_IDENTIFIER_PREFIX))
+    except OSError:
+        return False
+    return header[_PTE_IDENTIFIER_OFFSET:] == _PTE_IDENTIFIER_PREFIX
+
+
+def _write_program(et_program, output_path: str) -> None:
+    """Atomically write an ExecuTorch program to disk and drop it from the page cache.
+
+    The program is written to a temporary sibling, fsynced and renamed over
+    ``output_path``, so an interrupted export never leaves a truncated .pte.
+    """
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    fd = os.open(tmp_path, flags, 0o644)
+    try:
+        if hasattr(et_program, "write_to_file"):
+            # write_to_file streams the serialized flatbuffer without an extra bytes copy
+            with os.fdopen(fd, "wb", closefd=False) as f:
+                et_program.write_to_file(f)
+        else:
+            # Older ExecuTorch: write the serialized buffer in bounded chunks, copy-free
+            view = memoryview(et_program.buffer)
+            if hasattr(os, "posix_fallocate"):
+                # Size is known up front: reserve contiguous extents for the whole file
+                os.posix_fallocate(fd, 0, len(view))
+            while view:
+                written = os.write(fd, view[:_WRITE_CHUNK_BYTES])
+                view = view[written:]
+        os.fsync(fd)
+        if hasattr(os, "posix_fadvise"):
+            # The exporter never reads the .pte back, so don't let it evict useful pages
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_path)
+        raise
+    os.close(fd)
+    os.replace(tmp_path, output_path)
 
 
 @dataclass
@@ -29,11 +141,27 @@ class ExportConfig:
     backends: List[str]
     output_dir: str
     quantize: bool = False
+    precision: str = "fp32"  # "fp32", "fp16", "bf16" or "int8" (quantize=True implies "int8")
+    channels_last: bool = False  # Trace in NHWC, XNNPACK's native layout
+    calibration_inputs: Optional[Iterable[Tuple[torch.Tensor, ...]]] = None  # Re-iterable
+    calibration_id: Optional[str] = None  # Identifies real calibration data in cache keys
     input_shapes: Optional[List[List[int]]] = None
     input_dtypes: Optional[List[str]] = None
     optimize_for_mobile: bool = True
-    enable_dynamic_shape: bool = False
+    enable_dynamic_shape: bool = False  # Symbolic batch dim (1..max_batch_size) on every input
+    max_batch_size: int = 8
     export_format: str = "pte"  # Future: support other formats
+    cache_dir: Optional[str] = None  # Content-addressed .pte cache (disabled when None)
+    backend_jobs: int = 1  # Worker processes lowering backends in parallel
+    verify: bool = False  # Load and run each written .pte with the ExecuTorch runtime
+
+    def __post_init__(self):
+        if self.precision not in ("fp32", "int8", *HALF_PRECISION_DTYPES):
+            raise ValueError(f"Unsupported precision: {self.precision}")
+        # Keep the legacy quantize flag and precision in sync
+        if self.quantize:
+            self.precision = "int8"
+        self.quantize = self.precision == "int8"
 
 
 @dataclass
@@ -49,6 +177,32 @@ class ExportResult:
     metadata: Optional[Dict[str, Any]] = None
 
 
+@dataclass
+class PreparedExport:
+    """Traced model ready for per-backend lowering (see ``ExecuTorchExporter.prepare_export``)."""
+    config: ExportConfig
+    model_metadata: Dict[str, Any]
+    cache_paths: Dict[str, Path]
+    exported_program: Optional[Any] = None  # None when every backend is a cache hit
+    sample_inputs: Tuple[torch.Tensor, ...] = ()  # As traced (layout/dtype applied), for verify
+
+
+def _lower_saved_program(
+    program_path: str, backend: str, precision: str, output_path: str, num_threads: int
+) -> float:
+    """Worker entry point: lower a saved ExportedProgram for one backend and write the .pte.
+
+    Returns the lowering time in seconds.
+    """
+    start_time = time.time()
+    torch.set_grad_enabled(False)
+    torch.set_num_threads(num_threads)
+    exported_program = torch.export.load(program_path)
+    et_program = ExecuTorchExporter()._lower_for_backend(exported_program, backend, precision)
+    _write_program(et_program, output_path)
+    return time.time() - start_time
+
+
 class ExecuTorchExporter:
     """Generic ExecuTorch model exporter with backend auto-detection."""
 
@@ -93,6 +247,8 @@ class ExecuTorchExporter:
 
     def __init__(self):
         self.available_backends = self._detect_available_backends()
+        # Partitioner instances are stateless across programs, so build each one once
+        self._partitioners: Dict[str, List[Any]] = {}
 
     def _detect_available_backends(self) -> Dict[str, bool]:
         """Detect which backends are available in the current environment."""
@@ -121,18 +277,40 @@ class ExecuTorchExporter:
 
         return available
 
-    def _get_backend_partitioner(self, backend: str):
-        """Get the appropriate partitioner for the specified backend."""
+    def _get_backend_partitioner(self, backend: str, precision: str = "fp32"):
+        """Get the appropriate (cached) partitioner for the specified backend."""
         if not self.available_backends.get(backend, False):
             return None
 
+        key = f"{backend}:{precision}"
+        if key not in self._partitioners:
+            partitioner = self._create_backend_partitioner(backend, precision)
+            if partitioner is None:
+                return None
+            self._partitioners[key] = partitioner
+
+        return self._partitioners[key]
+
+    def _create_backend_partitioner(self, backend: str, precision: str = "fp32"):
+        """Instantiate the partitioner for the specified backend."""
         try:
             if backend == "coreml":
                 from executorch.backends.apple.coreml.partition import CoreMLPartitioner
                 return [CoreMLPartitioner()]
             elif backend == "xnnpack":
                 from executorch.backends.xnnpack.partition.xnnpack_partitioner import XnnpackPartitioner
-                return [XnnpackPartitioner()]
+                try:
+                    from executorch.backends.xnnpack.partition.config.xnnpack_config import (
+                        ConfigPrecisionType,
+                    )
+                except ImportError:
+                    return [XnnpackPartitioner()]
+                # Only match the op configs the graph can contain: float configs also cover
+                # fp16/bf16 graphs, int8 graphs add the static-quant configs
+                precisions = [ConfigPrecisionType.FP32]
+                if precision == "int8":
+                    precisions.insert(0, ConfigPrecisionType.STATIC_QUANT)
+                return [XnnpackPartitioner(config_precisions=precisions)]
             elif backend == "vulkan":
                 from executorch.backends.vulkan.partition.vulkan_partitioner import VulkanPartitioner
                 return [VulkanPartitioner()]
@@ -163,18 +341,66 @@ class ExecuTorchExporter:
 
         return {"input_specs": specs, "num_inputs": len(specs)}
 
-    def _apply_optimizations(self, model: nn.Module, config: ExportConfig) -> nn.Module:
+    def _quantize_pt2e(
+        self,
+        model: nn.Module,
+        sample_inputs: Tuple[torch.Tensor, ...],
+        calibration_inputs: Optional[Iterable[Tuple[torch.Tensor, ...]]] = None,
+        channels_last: bool = False,
+        dynamic_shapes: Optional[Tuple] = None
+    ) -> nn.Module:
+        """Apply PT2E static INT8 quantization for XNNPACK's QS8 kernels."""
+        try:
+            from torchao.quantization.pt2e.quantize_pt2e import prepare_pt2e, convert_pt2e
+        except ImportError:
+            # Older ExecuTorch releases still use the torch.ao PT2E flow
+            from torch.ao.quantization.quantize_pt2e import prepare_pt2e, convert_pt2e
+        from executorch.backends.xnnpack.quantizer.xnnpack_quantizer import (
+            XNNPACKQuantizer,
+            get_symmetric_quantization_config,
+        )
+
+        # Signed int8, per-channel symmetric weights map onto XNNPACK's fast QS8 GEMM/conv paths
+        quantizer = XNNPACKQuantizer().set_global(
+            get_symmetric_quantization_config(is_per_channel=True, is_dynamic=False)
+        )
+
+        if hasattr(torch.export, "export_for_training"):
+            captured = torch.export.export_for_training(
+                model, sample_inputs, dynamic_shapes=dynamic_shapes
+            ).module()
+        else:
+            captured = export(model, sample_inputs, dynamic_shapes=dynamic_shapes).module()
+
+        prepared = prepare_pt2e(captured, quantizer)
+
+        # Calibrate observers (falls back to the sample inputs if no calibration set is given).
+        # Batches are converted one at a time, so a lazily generated set stays lazy.
+        for batch in calibration_inputs or [sample_inputs]:
+            prepared(*(_to_channels_last(batch) if channels_last else batch))
+
+        return convert_pt2e(prepared, fold_quantize=True)
+
+    def _apply_optimizations(
+        self,
+        model: nn.Module,
+        sample_inputs: Tuple[torch.Tensor, ...],
+        config: ExportConfig,
+        dynamic_shapes: Optional[Tuple] = None
+    ) -> nn.Module:
         """Apply model optimizations based on configuration."""
         optimized_model = model
 
         if config.quantize:
-            print("Applying dynamic quantization...")
-            # Apply dynamic quantization for mobile deployment
-            optimized_model = torch.quantization.quantize_dynamic(
-                optimized_model,
-                {nn.Linear, nn.Conv2d},
-                dtype=torch.qint8
+            print("Applying PT2E INT8 quantization (XNNPACKQuantizer, per-channel)...")
+            optimized_model = self._quantize_pt2e(
+                optimized_model, sample_inputs, config.calibration_inputs, config.channels_last,
+                dynamic_shapes
             )
+        elif config.precision in HALF_PRECISION_DTYPES:
+            print(f"Casting weights to {config.precision.upper()}...")
+            # Copy so the caller's model (and its weights digest) stays fp32
+            optimized_model = copy.deepcopy(optimized_model).to(HALF_PRECISION_DTYPES[config.precision])
 
         if config.optimize_for_mobile:
             # Additional mobile optimizations can be added here
@@ -199,13 +425,49 @@ class ExecuTorchExporter:
         Returns:
             List of export results for each backend
         """
-        results = []
+        return self.lower_prepared(self.prepare_export(model, sample_inputs, config))
+
+    def prepare_export(
+        self,
+        model: nn.Module,
+        sample_inputs: Tuple[torch.Tensor, ...],
+        config: ExportConfig
+    ) -> PreparedExport:
+        """
+        Optimize and trace a model ahead of lowering (first half of ``export_model``).
+
+        The returned object holds everything lowering needs, so callers can drop
+        their eager model before ``lower_prepared`` to reduce peak memory.
+
+        Args:
+            model: PyTorch model in eval mode
+            sample_inputs: Tuple of sample input tensors
+            config: Export configuration
 
-        # Ensure model is in eval mode
-        model.eval()
+        Returns:
+            Prepared export to pass to ``lower_prepared``
+        """
+        # Ensure model is in eval mode with frozen weights (no autograd metadata while tracing)
+        model.eval().requires_grad_(False)
+
+        if config.channels_last:
+            model = model.to(memory_format=torch.channels_last)
+            sample_inputs = _to_channels_last(sample_inputs)
+
+        if config.precision in HALF_PRECISION_DTYPES:
+            # Half-precision programs take half-precision inputs
+            dtype = HALF_PRECISION_DTYPES[config.precision]
+            sample_inputs = tuple(
+                t.to(dtype) if isinstance(t, torch.Tensor) and t.is_floating_point() else t
+                for t in sample_inputs
+            )
 
-        # Apply optimizations
-        optimized_model = self._apply_optimizations(model, config)
+        if config.channels_last and not all(
+            t.is_contiguous(memory_format=torch.channels_last)
+            for t in sample_inputs if isinstance(t, torch.Tensor) and t.dim() == 4
+        ):
+            # Without NHWC strides the traced graph silently keeps the NCHW layout
+            raise RuntimeError("channels_last export requested but sample inputs are not NHWC")
 
         # Infer model metadata
         model_metadata = self._infer_input_specs(model, sample_inputs)
@@ -216,6 +478,54 @@ class ExecuTorchExporter:
         print(f"Exporting model '{config.model_name}' to {len(config.backends)} backends...")
         print(f"Model metadata: {model_metadata}")
 
+        # Look up cached programs first so cache hits skip quantization and lowering entirely
+        cache_paths = {}
+        weights_digest = None
+        if config.cache_dir:
+            weights_digest = _state_dict_digest(model)
+            cache_paths = {
+                backend: self._cache_path(config, backend, weights_digest, sample_inputs)
+                for backend in config.backends
+            }
+
+        # Trace once and share the ExportedProgram across every backend that needs lowering
+        exported_program = None
+        if not cache_paths or not all(_is_pte_file(path) for path in cache_paths.values()):
+            exported_program = self._export_program(model, sample_inputs, config, weights_digest)
+
+        return PreparedExport(
+            config=config,
+            model_metadata=model_metadata,
+            cache_paths=cache_paths,
+            exported_program=exported_program,
+            sample_inputs=sample_inputs,
+        )
+
+    def lower_prepared(self, prepared: PreparedExport) -> List[ExportResult]:
+        """
+        Lower a prepared export for each configured backend and write the .pte files.
+
+        Args:
+            prepared: Result of ``prepare_export``
+
+        Returns:
+            List of export results for each backend
+        """
+        config = prepared.config
+        model_metadata = prepared.model_metadata
+        cache_paths = prepared.cache_paths
+        results = []
+
+        pending = [
+            backend for backend in config.backends
+            if self.available_backends.get(backend, False)
+            and not (backend in cache_paths and _is_pte_file(cache_paths[backend]))
+        ]
+        lowered = {}
+        if config.backend_jobs > 1 and len(pending) > 1 and prepared.exported_program is not None:
+            lowered = self._lower_in_workers(prepared, pending)
+        serial = [backend for backend in pending if backend not in lowered]
+
         for backend in config.backends:
             print(f"\nExporting for {backend} backend...")
 
@@ -223,51 +533,45 @@ class ExecuTorchExporter:
                 raise RuntimeError(f"Backend {backend} not available in environment")
 
             try:
-                import time
                 start_time = time.time()
 
-                # Export based on backend type
-                if backend == "portable":
-                    et_program = to_edge(
-                        export(optimized_model, sample_inputs),
-                    ).to_executorch()
+                filename = self._output_filename(config, backend)
+                output_path = os.path.join(config.output_dir, filename)
+                cache_path = cache_paths.get(backend)
+                cached = cache_path is not None and _is_pte_file(cache_path)
+
+                if cached:
+                    shutil.copyfile(cache_path, output_path)
+                elif backend in lowered:
+                    # Lowered by a worker process; only the bookkeeping is left
+                    start_time -= lowered[backend]
+                else:
+                    # Lowering can mutate its input, and a failed partitioning would hand a
+                    # half-lowered graph to the next backend: give all but the last one a copy
+                    exported_program = prepared.exported_program
+                    if backend != serial[-1]:
+                        exported_program = copy.deepcopy(exported_program)
 
-                elif backend == "mps":
-                    # MPS typically doesn't require special partitioning
-                    et_program = to_edge(
-                        export(optimized_model, sample_inputs),
-                    ).to_executorch()
+                    # Lowering without autograd skips grad bookkeeping and keeps peak RSS down
+                    with torch.no_grad():
+                        et_program = self._lower_for_backend(
+                            exported_program, backend, config.precision
+                        )
+                    del exported_program
 
-                else:
-                    # Backend with specific partitioner
-                    partitioner = self._get_backend_partitioner(backend)
-                    if partitioner is None:
-                        raise RuntimeError(f"Failed to get partitioner for {backend}")
-
-                    compile_config = None
-                    if backend == "coreml":
-                        compile_config = EdgeCompileConfig(_skip_dim_order=True)
-                    elif backend == "xnnpack":
-                        compile_config = EdgeCompileConfig(_skip_dim_order=True)
-
-                    et_program = to_edge_transform_and_lower(
-                        export(optimized_model, sample_inputs),
-                        partitioner=partitioner,
-                        compile_config=compile_config,
-                    ).to_executorch()
-
-                # Generate filename
-                suffix = "_quantized" if config.quantize else ""
-                # Don't add backend suffix if model name already ends with it
-                if config.model_name.endswith(f"_{backend}"):
-                    filename = f"{config.model_name}{suffix}.{config.export_format}"
-                else:
-                    filename = f"{config.model_name}_{backend}{suffix}.{config.export_format}"
-                output_path = os.path.join(config.output_dir, filename)
+                    # Write model to file
+                    _write_program(et_program, output_path)
+
+                if not _is_pte_file(output_path):
+                    raise RuntimeError(f"{output_path} is not a valid ExecuTorch program")
 
-                # Write model to file
-                with open(output_path, "wb") as f:
-                    et_program.write_to_file(f)
+                output_shapes = None
+                if config.verify:
+                    output_shapes = self._verify_program(output_path, backend, prepared.sample_inputs)
+
+                # Only programs that passed the checks above become cache hits for later runs
+                if not cached and cache_path is not None:
+                    self._store_in_cache(output_path, cache_path)
 
                 end_time = time.time()
                 export_time = end_time - start_time
@@ -283,11 +587,17 @@ class ExecuTorchExporter:
                     metadata={
                         **model_metadata,
                         "backend_info": self.BACKEND_INFO.get(backend, {}),
-                        "quantized": config.quantize
+                        "quantized": config.quantize,
+                        "precision": config.precision,
+                        "channels_last": config.channels_last,
+                        "max_batch_size": config.max_batch_size if config.enable_dynamic_shape else 1,
+                        "cached": cached,
+                        "verified_output_shapes": output_shapes
                     }
                 )
 
-                print(f"✓ Exported {backend}: {filename} ({file_size_mb:.1f} MB)")
+                status = "cached" if cached else "Exported"
+                print(f"✓ {status} {backend}: {filename} ({file_size_mb:.1f} MB)")
                 results.append(result)
 
             except Exception as e:
@@ -304,6 +614,223 @@ class ExecuTorchExporter:
 
         return results
 
+    # Delegates the host ExecuTorch runtime can execute (Core ML/MPS/Vulkan need device runtimes)
+    _HOST_RUNNABLE_BACKENDS = ("portable", "xnnpack")
+
+    def _verify_program(
+        self, output_path: str, backend: str, sample_inputs: Tuple[torch.Tensor, ...]
+    ) -> Optional[List[List[int]]]:
+        """Load a written .pte with the ExecuTorch runtime and run ``forward`` once.
+
+        Catches programs that serialize fine but fail to load or execute, before
+        they reach a device. The runtime loads from the file path (mmap'd), so no
+        second copy of the program is made. Returns the output shapes, or None
+        when ``backend`` can't run on this host.
+        """
+        if backend not in self._HOST_RUNNABLE_BACKENDS:
+            print(f"  Skipping verification: {backend} does not run on the host runtime")
+            return None
+
+        from executorch.runtime import Runtime
+
+        try:
+            method = Runtime.get().load_program(output_path).load_method("forward")
+            outputs = method.execute(tuple(sample_inputs))
+        except Exception as e:
+            raise RuntimeError(f"Verification of {os.path.basename(output_path)} failed: {e}") from e
+
+        output_shapes = [list(o.shape) for o in outputs if isinstance(o, torch.Tensor)]
+        print(f"  Verified with ExecuTorch runtime, outputs: {output_shapes}")
+        return output_shapes
+
+    def _lower_in_workers(self, prepared: PreparedExport, backends: List[str]) -> Dict[str, float]:
+        """Lower ``backends`` concurrently in worker processes (``torch.export`` holds the GIL).
+
+        The ExportedProgram is saved once and each worker loads it, so no module or
+        tensor crosses the process boundary. Returns ``{backend: seconds}`` for the
+        backends whose .pte was written; failed ones are left to the serial path.
+        """
+        config = prepared.config
+        jobs = min(config.backend_jobs, len(backends))
+        num_threads = max(1, torch.get_num_threads() // jobs)
+        lowered = {}
+
+        print(f"Lowering {len(backends)} backends across {jobs} worker processes...")
+        with tempfile.TemporaryDirectory(prefix="executorch_export_") as tmp_dir:
+            program_path = os.path.join(tmp_dir, f"{config.model_name}.pt2")
+            try:
+                torch.export.save(prepared.exported_program, program_path)
+            except Exception as e:
+                warnings.warn(f"Could not save program for parallel lowering, lowering serially: {e}")
+                return lowered
+
+            with ProcessPoolExecutor(max_workers=jobs,
+                                     mp_context=multiprocessing.get_context("spawn")) as executor:
+                futures = {
+                    backend: executor.submit(
+                        _lower_saved_program, program_path, backend, config.precision,
+                        os.path.join(config.output_dir, self._output_filename(config, backend)),
+                        num_threads,
+                    )
+                    for backend in backends
+                }
+                for backend, future in futures.items():
+                    try:
+                        lowered[backend] = future.result()
+                    except Exception as e:
+                        # e.g. quantized ops not registered when the worker loads the program
+                        warnings.warn(f"Parallel lowering failed for {backend}, retrying serially: {e}")
+
+        return lowered
+
+    def _export_program(
+        self,
+        model: nn.Module,
+        sample_inputs: Tuple[torch.Tensor, ...],
+        config: ExportConfig,
+        weights_digest: Optional[str] = None
+    ):
+        """Optimize and ``torch.export`` a model, reusing a cached ExportedProgram when possible.
+
+        Traced programs are cached under ``<cache_dir>/exported`` keyed by weights,
+        inputs, precision and the torch/model-library versions (not ExecuTorch's, so
+        an ExecuTorch upgrade only re-runs lowering).
+        """
+        program_path = None
+        if config.cache_dir and weights_digest is not None:
+            program_path = self._exported_program_path(config, weights_digest, sample_inputs, model)
+            if program_path.is_file():
+                try:
+                    print(f"Reusing traced program: {program_path.name}")
+                    return torch.export.load(str(program_path))
+                except Exception as e:
+                    # e.g. custom quantized ops not registered yet in this process
+                    warnings.warn(f"Could not load cached program {program_path}: {e}")
+
+        dynamic_shapes = None
+        if config.enable_dynamic_shape:
+            print(f"Tracing with a dynamic batch dimension (1..{config.max_batch_size})")
+            sample_inputs, dynamic_shapes = _dynamic_batch(sample_inputs, config.max_batch_size)
+
+        with torch.no_grad():
+            # Apply optimizations (calibration forwards never need autograd)
+            optimized_model = self._apply_optimizations(model, sample_inputs, config, dynamic_shapes)
+            exported_program = export(optimized_model, sample_inputs, dynamic_shapes=dynamic_shapes)
+
+        if program_path is not None:
+            try:
+                program_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = program_path.with_name(f"{program_path.name}.{os.getpid()}.tmp")
+                torch.export.save(exported_program, str(tmp_path))
+                os.replace(tmp_path, program_path)
+            except Exception as e:
+                warnings.warn(f"Could not cache traced program for {config.model_name}: {e}")
+
+        return exported_program
+
+    def _lower_for_backend(
+        self,
+        exported_program,
+        backend: str,
+        precision: str = "fp32"
+    ):
+        """Lower an ExportedProgram for one backend, returning the ExecuTorch program."""
+        # XNNPACK and Core ML expect contiguous (non dim-order) ops. Edge IR validity checks
+        # stay on, so lowering errors surface at export time rather than on device
+        compile_config = EdgeCompileConfig(_skip_dim_order=backend in ("coreml", "xnnpack"))
+
+        if backend in ("portable", "mps"):
+            # No partitioner (MPS typically doesn't require special partitioning);
+            # every backend goes through the same single-pass lowering entry point
+            return to_edge_transform_and_lower(
+                exported_program,
+                compile_config=compile_config,
+            ).to_executorch()
+
+        # Backend with specific partitioner
+        partitioner = self._get_backend_partitioner(backend, precision)
+        if partitioner is None:
+            raise RuntimeError(f"Failed to get partitioner for {backend}")
+
+        return to_edge_transform_and_lower(
+            exported_program,
+            partitioner=partitioner,
+            compile_config=compile_config,
+        ).to_executorch()
+
+    @staticmethod
+    def _output_filename(config: ExportConfig, backend: str) -> str:
+        """Generate the .pte filename for a backend."""
+        suffix = "" if config.precision == "fp32" else f"_{config.precision}"
+        # Don't add backend suffix if model name already ends with it
+        if config.model_name.endswith(f"_{backend}"):
+            return f"{config.model_name}{suffix}.{config.export_format}"
+        return f"{config.model_name}_{backend}{suffix}.{config.export_format}"
+
+    def _cache_path(
+        self,
+        config: ExportConfig,
+        backend: str,
+        weights_digest: str,
+        sample_inputs: Tuple[torch.Tensor, ...]
+    ) -> Path:
+        """Content-addressed cache location for an exported program."""
+        input_signature = [
+            (tuple(t.shape), str(t.dtype)) for t in sample_inputs if isinstance(t, torch.Tensor)
+        ]
+        key_parts = (
+            config.model_name,
+            backend,
+            weights_digest,
+            repr(input_signature),
+            config.precision,
+            repr(config.channels_last),
+            config.calibration_id or "",
+            f"batch<={config.max_batch_size}" if config.enable_dynamic_shape else "",
+            _package_version("executorch"),
+            torch.__version__,
+        )
+        key = hashlib.blake2b("\0".join(key_parts).encode(), digest_size=20).hexdigest()
+        return Path(config.cache_dir) / f"{key}.{config.export_format}"
+
+    def _exported_program_path(
+        self,
+        config: ExportConfig,
+        weights_digest: str,
+        sample_inputs: Tuple[torch.Tensor, ...],
+        model: nn.Module
+    ) -> Path:
+        """Cache location for a traced (pre-lowering) ExportedProgram."""
+        input_signature = [
+            (tuple(t.shape), str(t.dtype)) for t in sample_inputs if isinstance(t, torch.Tensor)
+        ]
+        # The model's own library (torchvision, ultralytics, ...) defines its forward()
+        model_library = type(model).__module__.split(".")[0]
+        key_parts = (
+            config.model_name,
+            weights_digest,
+            repr(input_signature),
+            config.precision,
+            repr(config.channels_last),
+            config.calibration_id or "",
+            f"batch<={config.max_batch_size}" if config.enable_dynamic_shape else "",
+            torch.__version__,
+            f"{model_library}=={_package_version(model_library)}",
+        )
+        key = hashlib.blake2b("\0".join(key_parts).encode(), digest_size=20).hexdigest()
+        return Path(config.cache_dir) / "exported" / f"{key}.pt2"
+
+    @staticmethod
+    def _store_in_cache(output_path: str, cache_path: Path) -> None:
+        """Copy an exported program into the cache (atomic, safe for parallel exports)."""
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+            shutil.copyfile(output_path, tmp_path)
+            os.replace(tmp_path, cache_path)
+        except OSError as e:
+            warnings.warn(f"Could not cache {output_path}: {e}")
+
     def get_recommended_backends(self, target_platform: str) -> List[str]:
         """Get recommended backends for a target platform."""
         recommendations = {
@@ -417,8 +944,11 @@ def main():
         help="Target platform for backend recommendations"
     )
     parser.add_argument("--output-dir", default="./exported_models", help="Output directory")
-    parser.add_argument("--quantize", action="store_true", help="Apply quantization")
+    parser.add_argument("--precision", choices=["fp32", "fp16", "bf16", "int8"], default="fp32",
+                        help="Weight precision (default: fp32)")
+    parser.add_argument("--quantize", action="store_true", help="Apply quantization (same as --precision int8)")
     parser.add_argument("--create-summary", action="store_true", help="Create JSON export summary")
+    parser.add_argument("--cache-dir", default=None, help="Reuse/store exported programs in this cache directory")
 
     args = parser.parse_args()
 
@@ -452,8 +982,10 @@ def main():
             backends=backends,
             output_dir=args.output_dir,
             quantize=args.quantize,
+            precision=args.precision,
             input_shapes=input_shapes,
-            input_dtypes=args.input_dtypes
+            input_dtypes=args.input_dtypes,
+            cache_dir=args.cache_dir
         )
 
         # Export model
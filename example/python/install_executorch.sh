@@ -20,6 +20,53 @@ if [[ "$PYTHON_VERSION" < "3.10" ]]; then
     exit 1
 fi
 
+# Reuse downloaded wheels across runs
+PIP_CACHE_DIR="${PIP_CACHE_DIR:-$HOME/.cache/executorch_setup}"
+
+# pip_install [--pip-option=value ...] package ...
+# Installs only the packages that aren't already satisfied, in a single pip resolve,
+# so re-running the script skips pip (and its dependency resolver) entirely.
+pip_install() {
+    local opts=() pkgs=() missing
+    for arg in "$@"; do
+        case "$arg" in
+            --*) opts+=("$arg") ;;
+            *) pkgs+=("$arg") ;;
+        esac
+    done
+
+    missing=$(python3 - "${pkgs[@]}" <<'PY'
+import sys
+from importlib import metadata
+
+try:
+    from packaging.requirements import Requirement
+except ImportError:  # Without packaging only bare names can be checked
+    Requirement = None
+
+for spec in sys.argv[1:]:
+    try:
+        if Requirement is not None:
+            req = Requirement(spec)
+            if req.specifier.contains(metadata.version(req.name), prereleases=True):
+                continue
+        elif spec.replace("-", "").replace("_", "").isalnum():
+            metadata.version(spec)
+            continue
+    except metadata.PackageNotFoundError:
+        pass
+    print(spec)
+PY
+)
+
+    if [ -z "$missing" ]; then
+        echo "   ✅ Already installed: ${pkgs[*]}"
+        return 0
+    fi
+    # shellcheck disable=SC2086  # one requirement per word
+    pip3 install --prefer-binary --cache-dir "$PIP_CACHE_DIR" "${opts[@]}" $missing
+}
+
 echo ""
 echo "========================================================================"
 echo "  Step 1: Installing Core Dependencies"
@@ -28,7 +75,7 @@ echo ""
 
 # Install PyTorch first
 echo "📦 Installing PyTorch..."
-pip3 install torch torchvision --index-url https://download.pytorch.org/whl/cpu
+pip_install --index-url=https://download.pytorch.org/whl/cpu torch torchvision
 
 echo ""
 echo "========================================================================"
@@ -38,7 +85,7 @@ echo ""
 
 # Install ExecuTorch with optimizations
 echo "📦 Installing ExecuTorch..."
-pip3 install executorch
+pip_install executorch
 
 echo ""
 echo "========================================================================"
@@ -46,18 +93,9 @@ echo "  Step 3: Installing Model Export Dependencies"
 echo "========================================================================"
 echo ""
 
-# Install model-specific dependencies
-echo "📦 Installing Ultralytics (YOLO)..."
-pip3 install ultralytics
-
-echo "📦 Installing Transformers (Gemma)..."
-pip3 install transformers accelerate
-
-echo "📦 Installing HuggingFace Hub..."
-pip3 install huggingface-hub
-
-echo "📦 Installing additional dependencies..."
-pip3 install numpy pillow
+# Install model-specific dependencies in one resolver pass
+echo "📦 Installing Ultralytics (YOLO), Transformers (Gemma), HuggingFace Hub, NumPy and Pillow..."
+pip_install ultralytics transformers accelerate huggingface-hub numpy pillow
 
 echo ""
 echo "========================================================================"
@@ -9,42 +9,436 @@ Usage:
     python main.py export                   # Export models
     python main.py export --mobilenet       # Export MobileNet only
     python main.py export --yolo yolo11n    # Export YOLO11n
+    python main.py labels                   # Generate label files
     python main.py validate                 # Validate all models
+    python main.py serve                    # Keep models loaded, read image paths from stdin
 """
 
+import os
 import sys
 import argparse
+import contextlib
+import copy
+import gc
+import multiprocessing as mp
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from functools import lru_cache, partial
 from pathlib import Path
 
-# Export functions
-from validate_all_models import ModelValidator
+from _coco import COCO_LABELS, COCO_LABELS_BYTES
 
-# Validation functions
-import torch
-import torchvision.models as models
+try:
+    import orjson  # Optional: much faster dumps for the ~256k-entry Gemma vocabulary
+except ImportError:
+    orjson = None
 
+# Single source of truth for asset locations: ../example/assets when it exists relative
+# to the working directory, otherwise ../assets (running from example/python)
+DEFAULT_ASSETS_DIR = "../example/assets" if Path("../example/assets").is_dir() else "../assets"
+DEFAULT_MODELS_DIR = f"{DEFAULT_ASSETS_DIR}/models"
+DEFAULT_IMAGES_DIR = f"{DEFAULT_ASSETS_DIR}/images"
+DEFAULT_RESULTS_FILE = f"{DEFAULT_ASSETS_DIR}/model_test_results.json"
 
-def export_mobilenet(output_dir="../assets/models", backends=None):
-    """Export MobileNet V3 Small with multiple backend support."""
-    print("\n" + "="*70)
-    print("  Exporting MobileNet V3 Small")
-    print("="*70 + "\n")
+# Ultralytics checkpoints export_yolo knows how to handle
+SUPPORTED_YOLO = frozenset({"yolo11n", "yolo11s", "yolov8n", "yolov8s", "yolov5n", "yolov5s"})
 
+# Random batches used to calibrate PT2E int8 observers
+CALIBRATION_BATCHES = 32
+
+# Upper bound on images read from --calibration-dir (sorted by name)
+CALIBRATION_MAX_IMAGES = 300
+CALIBRATION_IMAGE_SUFFIXES = frozenset({".jpg", ".jpeg", ".png", ".bmp", ".webp"})
+
+# Content-addressed cache of exported .pte programs, reused across runs
+EXPORT_CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "executorch_flutter"
+
+# Section banner pieces, built once
+_BAR70 = "=" * 70
+_SECTION_FMT = f"\n{_BAR70}\n  {{}}\n{_BAR70}\n"
+
+
+def print_section(title):
+    """Print a section banner."""
+    print(_SECTION_FMT.format(title))
+
+
+class _QuietStream:
+    """stdout stand-in for ``--quiet``: forwards only warning/error lines."""
+
+    _KEEP_MARKERS = ("❌", "⚠️", "✗")
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._pending = ""
+
+    def write(self, text):
+        *lines, self._pending = (self._pending + text).split("\n")
+        for line in lines:
+            if any(marker in line for marker in self._KEEP_MARKERS):
+                self._stream.write(line + "\n")
+        return len(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+@contextlib.contextmanager
+def _quiet_stdout(enabled=True):
+    """Within the block, drop progress output from stdout when ``enabled``."""
+    if not enabled:
+        yield
+        return
+    saved_stdout, sys.stdout = sys.stdout, _QuietStream(sys.stdout)
+    try:
+        yield
+    finally:
+        sys.stdout.flush()
+        sys.stdout = saved_stdout
+
+
+def _package_version(dist):
+    """Installed version of ``dist`` read from package metadata (no import), or None."""
+    from importlib import metadata
+    try:
+        return metadata.version(dist)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def _missing_modules(*names):
+    """Top-level modules among ``names`` that aren't installed, found without importing them.
+
+    Lets an export fail in milliseconds instead of after importing torch only to
+    hit a missing ExecuTorch or Ultralytics.
+    """
+    from importlib.util import find_spec
+    return [name for name in names if find_spec(name) is None]
+
+
+def _export_fingerprint(**sources):
+    """Describe everything an exported .pte depends on (never imports torch)."""
+    return {
+        "et_version": _package_version("executorch"),
+        "torch_version": _package_version("torch"),
+        **sources,
+    }
+
+
+def _manifest_path(output_dir, model_name, fingerprint):
+    """Export manifest location for a model's .pte files.
+
+    Manifests live in the cache dir rather than next to the models because
+    ``assets/models/`` is bundled into the Flutter app as a whole. They are keyed
+    on precision and layout too, so e.g. fp32 and int8 exports are tracked separately.
+    """
+    import hashlib
+    variant = f"{fingerprint.get('precision', 'fp32')}:{'nhwc' if fingerprint.get('channels_last') else 'nchw'}"
+    key = hashlib.sha1(f"{Path(output_dir).resolve()}:{model_name}:{variant}".encode()).hexdigest()
+    return EXPORT_CACHE_DIR / "manifests" / f"{key}.json"
+
+
+def _file_sha256(path):
+    """SHA-256 of a file, read in 1 MiB chunks."""
+    import hashlib
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _output_record(path):
+    """Manifest entry identifying the exact bytes of an exported file."""
+    st = os.stat(path)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": _file_sha256(path)}
+
+
+def _output_unchanged(path, recorded):
+    """Check an exported file against its recorded size/mtime, hashing only if the mtime moved."""
     try:
+        st = os.stat(path)
+    except OSError:
+        return False
+    if st.st_size != recorded.get("size"):
+        return False
+    if st.st_mtime_ns == recorded.get("mtime_ns"):
+        return True
+    # Touched or copied (e.g. git checkout): same bytes still count as up to date
+    return _file_sha256(path) == recorded.get("sha256")
+
+
+def _is_up_to_date(output_dir, model_name, backends, fingerprint):
+    """Return True when the last export of ``backends`` used ``fingerprint`` and its files are unchanged.
+
+    Backends that were unavailable at export time are remembered as requested,
+    so e.g. a Linux box without CoreML can still skip a finished export.
+    """
+    import json
+    try:
+        manifest = json.loads(_manifest_path(output_dir, model_name, fingerprint).read_text())
+    except (OSError, ValueError):
+        return False
+    outputs = manifest.get("outputs")
+    return (
+        manifest.get("fingerprint") == fingerprint
+        and manifest.get("backends") == sorted(backends)
+        and isinstance(outputs, dict)
+        and all(_output_unchanged(path, recorded) for path, recorded in outputs.items())
+    )
+
+
+def _record_export(output_dir, model_name, backends, fingerprint, results):
+    """Remember a fully successful export so the next run can skip it."""
+    import json
+    if not results or not all(r.success for r in results):
+        return
+    manifest = _manifest_path(output_dir, model_name, fingerprint)
+    try:
+        manifest.parent.mkdir(parents=True, exist_ok=True)
+        manifest.write_text(json.dumps({
+            "fingerprint": fingerprint,
+            "backends": sorted(backends),
+            "outputs": {r.output_path: _output_record(r.output_path) for r in results},
+        }))
+    except OSError as e:
+        print(f"⚠️  Could not record export manifest for {model_name}: {e}")
+
+
+@lru_cache(maxsize=1)
+def _get_exporter():
+    """Return a shared ExecuTorchExporter.
+
+    Backend detection imports every available partitioner module, and the
+    exporter caches partitioner instances, so sequential exports reuse both.
+    """
+    from executorch_exporter import ExecuTorchExporter
+    return ExecuTorchExporter()
+
+
+@lru_cache(maxsize=None)
+def _load_mobilenet_v3_small():
+    """Load pretrained MobileNet V3 Small once per process (callers get copies)."""
+    import torchvision.models as models
+    # Frozen weights: tracing and calibration forwards never record autograd history
+    return models.mobilenet_v3_small(weights='DEFAULT').eval().requires_grad_(False)
+
+
+@lru_cache(maxsize=None)
+def _load_yolo(model_name):
+    """Load an Ultralytics YOLO checkpoint once per process (callers get copies)."""
+    from ultralytics import YOLO
+    return YOLO(f"{model_name}.pt")
+
+
+def _calibration_files(calibration_dir, limit=CALIBRATION_MAX_IMAGES):
+    """Up to ``limit`` image paths from ``calibration_dir``, in a reproducible order.
+
+    Accepts a flat folder or an ImageFolder-style tree (one subdirectory per
+    class). Images are taken round-robin across directories, so a small limit
+    still samples every class instead of only the first few.
+    """
+    import itertools
+
+    groups = []
+    for root, dirs, files in os.walk(calibration_dir):
+        dirs.sort()
+        images = sorted(name for name in files
+                        if os.path.splitext(name)[1].lower() in CALIBRATION_IMAGE_SUFFIXES)
+        if images:
+            groups.append([Path(root, name) for name in images])
+    if not groups:
+        raise ValueError(f"No calibration images found in {calibration_dir}")
+
+    interleaved = itertools.chain.from_iterable(itertools.zip_longest(*groups))
+    return list(itertools.islice((p for p in interleaved if p is not None), limit))
+
+
+def _calibration_id(calibration_dir):
+    """Stable identity of a calibration set: its directory and the files it contributes."""
+    if calibration_dir is None:
+        return None
+    root = Path(calibration_dir)
+    files = [(p.relative_to(root).as_posix(), p.stat().st_size) for p in _calibration_files(root)]
+    return f"{root.resolve()}:{files!r}"
+
+
+class _RandomCalibration:
+    """``batches`` random calibration inputs drawn into one reused tensor.
+
+    Observers only read a batch during its forward pass, so refilling a single
+    buffer avoids keeping ``batches`` full-size tensors alive (~157 MB for YOLO).
+    Re-iterable: every pass draws fresh samples.
+    """
+
+    def __init__(self, shape, batches=CALIBRATION_BATCHES):
+        self.shape = shape
+        self.batches = batches
+
+    def __len__(self):
+        return self.batches
+
+    def __iter__(self):
         import torch
-        from pathlib import Path
-        from executorch_exporter import ExecuTorchExporter, ExportConfig
 
-        # Default backends: xnnpack for all platforms, coreml/mps for Apple, vulkan for Android
-        if backends is None:
-            backends = ['xnnpack', 'coreml', 'mps', 'vulkan']
+        buffer = torch.empty(self.shape, dtype=torch.float32)
+        for _ in range(self.batches):
+            yield (buffer.normal_(),)
+
+
+class _ImageCalibration:
+    """Calibration inputs preprocessed from ``paths`` one at a time, as they are iterated.
+
+    Only the batch being observed is alive (300 YOLO images would otherwise
+    hold ~1.5 GB). Re-iterable: every pass reads the images again.
+    """
+
+    def __init__(self, paths, preprocess):
+        self.paths = paths
+        self.preprocess = preprocess
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __iter__(self):
+        for path in self.paths:
+            yield (self.preprocess(str(path)),)
+
+
+def _calibration_inputs(calibration_dir, preprocess, shape):
+    """PT2E calibration batches: preprocessed images, or random tensors without a directory."""
+    if calibration_dir is None:
+        return _RandomCalibration(shape)
+    paths = _calibration_files(calibration_dir)
+    print(f"📷 Calibrating on {len(paths)} images from {calibration_dir}")
+    return _ImageCalibration(paths, preprocess)
+
+
+def _export_with_fallback(exporter, load_model, sample_inputs, config):
+    """Trace and lower ``load_model()``, retrying failed half-precision backends in FP32.
+
+    The eager model is created here and dropped right after tracing so it isn't
+    alive during EXIR lowering; ``load_model`` is only called again for a fallback.
+
+    Returns ``(results, fallback_backends)``: the backends in ``fallback_backends``
+    were written as regular FP32 programs (FP32 file names), not in ``config.precision``.
+    """
+    from dataclasses import replace
+
+    model = load_model()
+    prepared = exporter.prepare_export(model, sample_inputs, config)
+    del model
+    gc.collect()
+    results = exporter.lower_prepared(prepared)
+    del prepared
+
+    failed = [r.backend for r in results if not r.success]
+    if not (failed and config.precision in ("fp16", "bf16")):
+        return results, []
+
+    fallback_config = replace(config, precision="fp32", backends=failed)
+    fp32_files = ", ".join(exporter._output_filename(fallback_config, b) for b in failed)
+    print(f"\n⚠️  {config.precision.upper()} lowering failed for {', '.join(failed)}, "
+          f"falling back to FP32: this writes (and overwrites) {fp32_files}")
+    results = ([r for r in results if r.success]
+               + exporter.export_model(load_model(), sample_inputs, fallback_config))
+    return results, failed
+
+
+def _report_export(output_dir, model_name, backends, fingerprint, results, fallback_backends):
+    """Print an export's per-backend summary and record it if it fully succeeded.
+
+    Exports that fell back to FP32 for some backends are never recorded: their
+    requested-precision files don't exist, so the next run must try again.
+    Returns True when at least one backend was exported.
+    """
+    successful = [r for r in results if r.success]
+    failed = [r for r in results if not r.success]
+
+    if fallback_backends:
+        print(f"⚠️  Not marking {model_name} up to date: {', '.join(fallback_backends)} "
+              f"exported as FP32 instead of {fingerprint.get('precision', 'fp32').upper()}")
+    else:
+        _record_export(output_dir, model_name, backends, fingerprint, results)
+
+    if successful:
+        print(f"\n✅ Successfully exported {len(successful)}/{len(results)} backends")
+        for result in successful:
+            print(f"   • {result.backend}: {result.output_path.split('/')[-1]} ({result.file_size_mb:.1f} MB)")
+
+    if failed:
+        print(f"\n⚠️  Failed {len(failed)} backend(s):")
+        for result in failed:
+            print(f"   • {result.backend}: {result.error_message}")
+
+    return len(successful) > 0
 
-        # Load model
-        model = models.mobilenet_v3_small(weights='DEFAULT').eval()
-        sample_inputs = (torch.randn(1, 3, 224, 224),)
 
-        # Create exporter
-        exporter = ExecuTorchExporter()
+def export_mobilenet(output_dir=DEFAULT_MODELS_DIR, backends=None, quantize=False, cache_dir=None,
+                     force=False, precision="fp32", channels_last=False, calibration_dir=None,
+                     backend_jobs=1, verify=False):
+    """Export MobileNet V3 Small with multiple backend support.
+
+    With ``precision="int8"`` (or ``quantize``), the model goes through PT2E
+    static INT8 quantization (XNNPACKQuantizer, per-channel symmetric) before
+    lowering, so XNNPACK can dispatch its int8 dot-product kernels. Observers are
+    calibrated on the images in ``calibration_dir`` (ImageNet preprocessing), or on
+    random tensors when no directory is given.
+    ``precision="fp16"``/``"bf16"`` halves weights and inputs; backends that
+    reject the half-precision graph fall back to an FP32 export.
+
+    ``backend_jobs > 1`` lowers the backends in that many worker processes.
+    ``verify`` loads and runs every host-runnable .pte with the ExecuTorch runtime.
+
+    Unless ``force`` is set, the export is skipped when every target .pte is
+    already up to date with the installed torch/torchvision/ExecuTorch.
+    """
+    print_section("Exporting MobileNet V3 Small")
+
+    if quantize:
+        precision = "int8"
+    quantize = precision == "int8"
+
+    # Default backends: xnnpack for all platforms, coreml/mps for Apple, vulkan for Android
+    # XNNPACKQuantizer output only targets XNNPACK, so quantized exports default to it
+    if backends is None:
+        backends = ['xnnpack'] if quantize else ['xnnpack', 'coreml', 'mps', 'vulkan']
+    elif quantize and any(b != 'xnnpack' for b in backends):
+        print("⚠️  INT8 quantization targets XNNPACK; other backends may not delegate quantized ops")
+
+    fingerprint = _export_fingerprint(
+        weights="torchvision:MobileNet_V3_Small_Weights.DEFAULT",
+        torchvision_version=_package_version("torchvision"),
+        precision=precision,
+        channels_last=channels_last,
+        calibration=_calibration_id(calibration_dir) if quantize else None,
+    )
+    if not force and _is_up_to_date(output_dir, 'mobilenet_v3_small', backends, fingerprint):
+        print("✅ Up-to-date, skipping (use --force to re-export)")
+        return True
+
+    missing = _missing_modules("torch", "torchvision", "executorch")
+    if missing:
+        print(f"❌ Missing dependency: {', '.join(missing)} (run ./install_executorch.sh)")
+        return False
+
+    try:
+        import torch
+        from executorch_exporter import ExportConfig
+
+        # Tracing only needs shapes/dtypes: zeros skip the RNG fill (calibration batches are separate)
+        sample_inputs = (torch.zeros(1, 3, 224, 224),)
+        calibration_inputs = None
+        if quantize:
+            from validate_all_models import ImageNetPreprocessor
+            calibration_inputs = _calibration_inputs(
+                calibration_dir, ImageNetPreprocessor.preprocess, (1, 3, 224, 224)
+            )
+
+        # Shared exporter (cached backend detection and partitioners)
+        exporter = _get_exporter()
 
         # Filter backends to only available ones
         available_backends = [b for b in backends if exporter.available_backends.get(b, False)]
@@ -61,69 +455,159 @@ def export_mobilenet(output_dir="../assets/models", backends=None):
             model_name='mobilenet_v3_small',
             backends=available_backends,
             output_dir=output_dir,
-            quantize=False,
+            precision=precision,
+            channels_last=channels_last,
+            calibration_inputs=calibration_inputs,
+            calibration_id=fingerprint["calibration"],
             input_shapes=[[1, 3, 224, 224]],
-            input_dtypes=['float32']
+            input_dtypes=['float32'],
+            cache_dir=cache_dir,
+            backend_jobs=backend_jobs,
+            verify=verify
         )
 
-        # Export to all backends
-        results = exporter.export_model(model, sample_inputs, config)
+        # Export to all backends (model copied so exports can't leak state into the cached instance)
+        results, fallback_backends = _export_with_fallback(
+            exporter, lambda: copy.deepcopy(_load_mobilenet_v3_small()), sample_inputs, config
+        )
 
-        # Check success
-        successful = [r for r in results if r.success]
-        failed = [r for r in results if not r.success]
+        return _report_export(output_dir, 'mobilenet_v3_small', backends, fingerprint, results,
+                              fallback_backends)
 
-        if successful:
-            print(f"\n✅ Successfully exported {len(successful)}/{len(results)} backends")
-            for result in successful:
-                print(f"   • {result.backend}: {result.output_path.split('/')[-1]} ({result.file_size_mb:.1f} MB)")
+    except ImportError as e:
+        print(f"❌ Missing dependency: {e}")
+        return False
+    except (RuntimeError, ValueError, OSError) as e:
+        # torch.export/Dynamo errors are RuntimeErrors; anything else is a bug and propagates
+        print(f"❌ Export failed: {type(e).__name__}: {e}")
+        return False
 
-        if failed:
-            print(f"\n⚠️  Failed {len(failed)} backend(s):")
-            for result in failed:
-                print(f"   • {result.backend}: {result.error_message}")
 
-        return len(successful) > 0
+def _detect_head_separate_forward(self, x):
+    """Ultralytics ``Detect`` inference, returning boxes and class scores as two tensors.
 
-    except Exception as e:
-        print(f"❌ Export failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    Mirrors ``Detect._inference`` but skips the final box/score concat, whose
+    shared quantization scale would crush the [0, 1] scores next to pixel boxes.
+    """
+    import torch
+    from ultralytics.utils.tal import make_anchors
 
+    for i in range(self.nl):
+        x[i] = torch.cat((self.cv2[i](x[i]), self.cv3[i](x[i])), 1)
+    shape = x[0].shape
+    x_cat = torch.cat([xi.view(shape[0], self.no, -1) for xi in x], 2)
+    if self.shape != shape:
+        self.anchors, self.strides = (a.transpose(0, 1) for a in make_anchors(x, self.stride, 0.5))
+        self.shape = shape
+    box, cls = x_cat.split((self.reg_max * 4, self.nc), 1)
+    dbox = self.decode_bboxes(self.dfl(box), self.anchors.unsqueeze(0)) * self.strides
+    return dbox, cls.sigmoid()
 
-def export_yolo(model_name="yolo11n", output_dir="../assets/models", backends=None):
-    """Export YOLO model with multiple backend support."""
-    print("\n" + "="*70)
-    print(f"  Exporting {model_name.upper()}")
-    print("="*70 + "\n")
 
-    try:
-        import torch
-        import numpy as np
-        from pathlib import Path
-        from ultralytics import YOLO
-        from executorch_exporter import ExecuTorchExporter, ExportConfig
+def _yolo_head_supports_split(head):
+    """True if ``head`` is the anchor-free Ultralytics ``Detect`` layout the split forward mirrors."""
+    required = ("cv2", "cv3", "dfl", "decode_bboxes", "reg_max", "nc", "nl", "no", "stride")
+    return not getattr(head, "end2end", False) and all(hasattr(head, attr) for attr in required)
+
+
+def _separate_yolo_outputs(pt_model):
+    """Make the YOLO Detect head return ``(boxes [1,4,N], scores [1,nc,N])``."""
+    import types
 
-        # Default backends: xnnpack for all platforms, coreml/mps for Apple, vulkan for Android
-        if backends is None:
-            backends = ['xnnpack', 'coreml', 'mps', 'vulkan']
+    head = pt_model.model[-1]
+    head.export = True
+    head.forward = types.MethodType(_detect_head_separate_forward, head)
 
-        # Load YOLO model
-        model = YOLO(f"{model_name}.pt")
 
-        # Run a dummy prediction to initialize the model
-        np_dummy_tensor = np.ones((640, 640, 3))
-        model.predict(np_dummy_tensor, imgsz=(640, 640), device="cpu")
+def _load_yolo_for_export(model_name, separate_outputs=False):
+    """Private, warmed-up eval copy of the cached YOLO model, ready for tracing."""
+    import torch
 
-        # Get the PyTorch model and put in eval mode
-        pt_model = model.model.cpu().eval()
+    pt_model = copy.deepcopy(_load_yolo(model_name).model).cpu().eval().requires_grad_(False)
+
+    # One forward pass materializes the Detect head's lazily built anchors/strides;
+    # no need for the full predict() pipeline (letterbox + NMS).
+    with torch.no_grad():
+        _ = pt_model(torch.zeros(1, 3, 640, 640))
+
+    if separate_outputs:
+        _separate_yolo_outputs(pt_model)
+    return pt_model
+
+
+def export_yolo(model_name="yolo11n", output_dir=DEFAULT_MODELS_DIR, backends=None, cache_dir=None,
+                force=False, precision="fp32", separate_outputs=False, channels_last=False,
+                calibration_dir=None, backend_jobs=1, max_batch_size=1, verify=False):
+    """Export YOLO model with multiple backend support.
+
+    ``precision`` selects fp32, fp16/bf16 (FP32 fallback) or PT2E int8 (XNNPACK) weights.
+    INT8 observers are calibrated on the letterboxed images in ``calibration_dir``
+    (e.g. a few hundred COCO frames), or on random tensors when no directory is given.
+
+    Output: ``[1, 84, 8400]`` (boxes + class scores). With ``separate_outputs`` the
+    program is exported as ``<model>_split_<backend>.pte`` and returns
+    ``([1, 4, 8400], [1, 80, 8400])``, keeping box and score ranges apart for INT8.
+
+    ``backend_jobs > 1`` lowers the backends in that many worker processes.
+    ``verify`` loads and runs every host-runnable .pte with the ExecuTorch runtime.
+    ``max_batch_size > 1`` traces a symbolic batch dimension, so one .pte runs
+    any batch of 1..``max_batch_size`` frames.
+
+    Unless ``force`` is set, the export is skipped when every target .pte is
+    already up to date with the installed torch/Ultralytics/ExecuTorch.
+    """
+    # Reject typos before Ultralytics tries (and times out) downloading a nonexistent checkpoint
+    model_name = model_name.removesuffix(".pt")
+    if model_name not in SUPPORTED_YOLO:
+        raise ValueError(f"Unknown YOLO model {model_name!r}. Supported: {sorted(SUPPORTED_YOLO)}")
+
+    print_section(f"Exporting {model_name.upper()}")
+
+    # Default backends: xnnpack for all platforms, coreml/mps for Apple, vulkan for Android
+    # XNNPACKQuantizer output only targets XNNPACK, so quantized exports default to it
+    if backends is None:
+        backends = ['xnnpack'] if precision == "int8" else ['xnnpack', 'coreml', 'mps', 'vulkan']
+    elif precision == "int8" and any(b != 'xnnpack' for b in backends):
+        print("⚠️  INT8 quantization targets XNNPACK; other backends may not delegate quantized ops")
+
+    export_name = f"{model_name}_split" if separate_outputs else model_name
+    fingerprint = _export_fingerprint(
+        weights=f"ultralytics:{model_name}.pt",
+        ultralytics_version=_package_version("ultralytics"),
+        precision=precision,
+        channels_last=channels_last,
+        calibration=_calibration_id(calibration_dir) if precision == "int8" else None,
+        max_batch_size=max_batch_size,
+    )
+    if not force and _is_up_to_date(output_dir, export_name, backends, fingerprint):
+        print("✅ Up-to-date, skipping (use --force to re-export)")
+        return True
+
+    missing = _missing_modules("torch", "ultralytics", "executorch")
+    if missing:
+        print(f"❌ Missing dependency: {', '.join(missing)} (run ./install_executorch.sh)")
+        return False
+
+    try:
+        import torch
+        from executorch_exporter import ExportConfig
+
+        if separate_outputs and not _yolo_head_supports_split(_load_yolo(model_name).model.model[-1]):
+            print("⚠️  Unsupported detection head, exporting fused outputs")
+            separate_outputs = False
+            export_name = model_name
 
         # Prepare sample inputs (640x640 for YOLO)
-        sample_inputs = (torch.randn(1, 3, 640, 640),)
+        sample_inputs = (torch.zeros(1, 3, 640, 640),)
+        calibration_inputs = None
+        if precision == "int8":
+            from validate_all_models import YOLOPreprocessor
+            calibration_inputs = _calibration_inputs(
+                calibration_dir, lambda path: YOLOPreprocessor.preprocess(path)[0], (1, 3, 640, 640)
+            )
 
-        # Create exporter
-        exporter = ExecuTorchExporter()
+        # Shared exporter (cached backend detection and partitioners)
+        exporter = _get_exporter()
 
         # Filter backends to only available ones
         available_backends = [b for b in backends if exporter.available_backends.get(b, False)]
@@ -137,53 +621,190 @@ def export_yolo(model_name="yolo11n", output_dir="../assets/models", backends=No
 
         # Create export config
         config = ExportConfig(
-            model_name=model_name,
+            model_name=export_name,
             backends=available_backends,
             output_dir=output_dir,
-            quantize=False,
+            precision=precision,
+            channels_last=channels_last,
+            calibration_inputs=calibration_inputs,
+            calibration_id=fingerprint["calibration"],
             input_shapes=[[1, 3, 640, 640]],
-            input_dtypes=['float32']
+            input_dtypes=['float32'],
+            enable_dynamic_shape=max_batch_size > 1,
+            max_batch_size=max_batch_size,
+            cache_dir=cache_dir,
+            backend_jobs=backend_jobs,
+            verify=verify
         )
 
         # Export to all backends
-        results = exporter.export_model(pt_model, sample_inputs, config)
+        results, fallback_backends = _export_with_fallback(
+            exporter, partial(_load_yolo_for_export, model_name, separate_outputs), sample_inputs, config
+        )
+
+        exported = _report_export(output_dir, export_name, backends, fingerprint, results,
+                                  fallback_backends)
+
+        # Clean up downloaded model files (handles both .pt and variant names like yolov5nu.pt).
+        # DirEntry.name needs no stat, so only matching entries are inspected further.
+        with os.scandir(".") as entries:
+            for entry in entries:
+                if (entry.name.startswith(model_name) and entry.name.endswith(".pt")
+                        and entry.is_file(follow_symlinks=False)):
+                    os.unlink(entry.path)
+                    print(f"   Cleaned up: {entry.name}")
+
+        return exported
+
+    except ImportError as e:
+        print(f"❌ Missing dependency: {e}")
+        return False
+    except (RuntimeError, ValueError, OSError) as e:
+        # torch.export/Dynamo errors are RuntimeErrors; anything else is a bug and propagates
+        print(f"❌ Export failed: {type(e).__name__}: {e}")
+        return False
+
+
+def _write_json(path, data):
+    """Write ``data`` as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        import json
+        with open(path, "w") as f:
+            json.dump(data, f, indent=2)
 
-        # Check success
-        successful = [r for r in results if r.success]
-        failed = [r for r in results if not r.success]
 
-        if successful:
-            print(f"\n✅ Successfully exported {len(successful)}/{len(results)} backends")
-            for result in successful:
-                print(f"   • {result.backend}: {result.output_path.split('/')[-1]} ({result.file_size_mb:.1f} MB)")
+def _write_vocab_bin(path, vocab):
+    """Write ``vocab`` (token -> id) in the compact GVCB binary format.
 
-        if failed:
-            print(f"\n⚠️  Failed {len(failed)} backend(s):")
-            for result in failed:
-                print(f"   • {result.backend}: {result.error_message}")
+    Layout (little-endian): ``b"GVCB" | num_entries:u32`` followed by
+    ``id:u32 | len:u16 | utf8[len]`` per token, sorted by id.
+    """
+    import struct
+
+    chunks = [b"GVCB", struct.pack("<I", len(vocab))]
+    for token, idx in sorted(vocab.items(), key=lambda kv: kv[1]):
+        encoded = token.encode("utf-8")
+        if len(encoded) > 0xFFFF:
+            raise ValueError(f"Token {idx} ({token[:32]!r}...) is {len(encoded)} bytes; "
+                             "GVCB stores token lengths as u16 (max 65535)")
+        chunks.append(struct.pack("<IH", idx, len(encoded)))
+        chunks.append(encoded)
+    Path(path).write_bytes(b"".join(chunks))
 
-        # Clean up downloaded model files (handles both .pt and variant names like yolov5nu.pt)
-        for pt_file in Path.cwd().glob("*.pt"):
-            if pt_file.stem.startswith(model_name):
-                pt_file.unlink()
-                print(f"   Cleaned up: {pt_file.name}")
 
-        return len(successful) > 0
+def _optimum_cli_in_process(args):
+    """Run ``optimum-cli <args>`` inside this interpreter.
+
+    Avoids spawning a fresh Python that re-imports torch/transformers/executorch.
+    Returns the exit code, or None when optimum's CLI entry point isn't importable.
+    """
+    try:
+        from optimum.commands.optimum_cli import main as optimum_main
+    except ImportError:
+        return None
 
+    saved_argv = sys.argv
+    sys.argv = ["optimum-cli", *args]
+    try:
+        optimum_main()
+        return 0
+    except SystemExit as e:
+        if e.code is None or isinstance(e.code, int):
+            return e.code or 0
+        return 1
+    finally:
+        sys.argv = saved_argv
+
+
+def _optimum_cli_flags():
+    """Return the set of flags supported by the installed `optimum-cli export executorch`."""
+    import io
+    import re
+    import subprocess
+
+    help_args = ["export", "executorch", "--help"]
+    buffer = io.StringIO()
+    with contextlib.redirect_stdout(buffer):
+        returncode = _optimum_cli_in_process(help_args)
+    if returncode is not None:
+        help_text = buffer.getvalue()
+    else:
+        try:
+            help_text = subprocess.run(
+                ["optimum-cli", *help_args], capture_output=True, text=True
+            ).stdout
+        except OSError:
+            return set()
+    return set(re.findall(r"--[A-Za-z0-9_-]+", help_text))
+
+
+def _prefetch_hf_snapshot(model_id, max_workers=8):
+    """Make sure the HuggingFace weights for ``model_id`` are cached before optimum-cli runs.
+
+    Reuses an existing local snapshot, otherwise downloads it with parallel workers.
+    Any failure (missing huggingface_hub, no auth for the gated repo, offline) is
+    reported and left for optimum-cli to handle.
+    """
+    try:
+        from huggingface_hub import snapshot_download
+    except ImportError:
+        return
+
+    allow_patterns = ["*.safetensors", "*.json", "tokenizer*"]
+    try:
+        snapshot_download(repo_id=model_id, allow_patterns=allow_patterns, local_files_only=True)
+        print("   Using cached HuggingFace snapshot")
+        return
+    except Exception:
+        pass  # Not (fully) cached yet
+
+    print(f"⬇️  Downloading {model_id} from HuggingFace ({max_workers} workers)...")
+    try:
+        snapshot_download(repo_id=model_id, allow_patterns=allow_patterns, max_workers=max_workers)
     except Exception as e:
-        print(f"❌ Export failed: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+        print(f"⚠️  Snapshot download failed: {e}")
+        print("   If the model is gated, request access and run: hf auth login")
+
 
+def _run_streaming(cmd, tail_lines=200):
+    """Run ``cmd``, echoing its output live and keeping only the last lines for errors.
 
-def export_gemma(model_name="gemma-3-270m", output_dir="../assets/models"):
+    Returns a ``(returncode, tail)`` tuple. stderr is merged into stdout so download
+    progress and errors share one bounded buffer instead of piling up in memory.
+    """
+    import collections
+    import subprocess
+
+    tail = collections.deque(maxlen=tail_lines)
+    with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                          text=True, bufsize=1) as process:
+        for line in process.stdout:
+            sys.stdout.write(line)
+            tail.append(line)
+        process.wait()
+    return process.returncode, "".join(tail)
+
+
+def export_gemma(model_name="gemma-3-270m", output_dir=DEFAULT_MODELS_DIR,
+                 qlinear="8da4w", qembedding="8w", group_size=32,
+                 use_custom_sdpa=False, use_custom_kv_cache=False, vocab_format="json"):
     """Export Gemma text generation model using Optimum ExecuTorch.
 
     Supported models:
     - gemma-3-270m: 240 MB (text-only, 270M parameters)
     - gemma-3-1b: 892 MB - 1.5 GB (text-only, 1B parameters)
 
+    Quantization:
+    - qlinear: "8da4w" (int8 dynamic activations x int4 group-wise weights),
+      "4w" (int4 weight-only) or "none" (fp32 linears)
+    - qembedding: "8w", "4w" or "none"
+    - group_size: group size for int4 linear weights (smaller = more accurate, larger file)
+
+    Vocabulary:
+    - vocab_format: "json" (token -> id map) or "bin" (compact GVCB binary, ~3x smaller)
+
     IMPORTANT: Gemma models are gated on HuggingFace and require:
     1. Request access at https://huggingface.co/google/gemma-3-270m-it
     2. Authenticate with: hf auth login
@@ -191,14 +812,9 @@ def export_gemma(model_name="gemma-3-270m", output_dir="../assets/models"):
        git clone https://github.com/huggingface/optimum-executorch.git
        cd optimum-executorch && pip install '.[dev]' && python install_dev.py
     """
-    print("\n" + "="*70)
-    print(f"  Exporting {model_name.upper()}")
-    print("="*70 + "\n")
+    print_section(f"Exporting {model_name.upper()}")
 
     try:
-        import subprocess
-        from pathlib import Path
-        import json
         import shutil
 
         # Map model name to HuggingFace model ID
@@ -208,31 +824,54 @@ def export_gemma(model_name="gemma-3-270m", output_dir="../assets/models"):
         print(f"   Model ID: {model_id}")
         print(f"   This may take several minutes on first run...")
 
+        # Fetch weights up front so optimum-cli hits the cache (and auth errors show early)
+        _prefetch_hf_snapshot(model_id)
+
         # Create temporary output directory (use absolute path for optimum-cli)
         temp_output = Path(output_dir).resolve() / f"{model_name}_temp"
         temp_output.mkdir(parents=True, exist_ok=True)
 
         # Use optimum-cli to export the model
-        # Note: Removed --use_custom_sdpa and --use_custom_kv_cache flags
-        # as they require ExecuTorch features not available in v0.7.0
         cmd = [
             "optimum-cli", "export", "executorch",
             "--model", model_id,
             "--task", "text-generation",
             "--recipe", "xnnpack",
-            "--qlinear", "8da4w",
-            "--qembedding", "8w",
             "--output_dir", str(temp_output)
         ]
 
+        # Optional flags are only passed when the installed optimum-executorch supports them
+        # (--use_custom_sdpa/--use_custom_kv_cache need newer ExecuTorch than v0.7.0)
+        supported_flags = _optimum_cli_flags()
+        if qlinear != "none":
+            cmd += ["--qlinear", qlinear]
+            if qlinear in ("8da4w", "4w") and "--qlinear_group_size" in supported_flags:
+                cmd += ["--qlinear_group_size", str(group_size)]
+        if qembedding != "none":
+            cmd += ["--qembedding", qembedding]
+        for enabled, flag in ((use_custom_sdpa, "--use_custom_sdpa"),
+                              (use_custom_kv_cache, "--use_custom_kv_cache")):
+            if not enabled:
+                continue
+            if flag in supported_flags:
+                cmd.append(flag)
+            else:
+                print(f"⚠️  {flag} not supported by installed optimum-executorch, skipping")
+
         print(f"\n🔄 Running optimum-cli export...")
         print(f"   Command: {' '.join(cmd)}")
 
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        if result.returncode != 0:
-            print(f"❌ Export failed with exit code {result.returncode}")
-            print(f"   stderr: {result.stderr}")
+        # In-process when optimum is importable (output is already live on stdout),
+        # otherwise fall back to the optimum-cli executable
+        log_tail = ""
+        returncode = _optimum_cli_in_process(cmd[1:])
+        if returncode is None:
+            returncode, log_tail = _run_streaming(cmd)
+
+        if returncode != 0:
+            print(f"❌ Export failed with exit code {returncode}")
+            if log_tail:
+                print(f"   Last output:\n{log_tail}")
             return False
 
         print(f"✅ Model exported successfully!")
@@ -248,7 +887,8 @@ def export_gemma(model_name="gemma-3-270m", output_dir="../assets/models"):
         output_path.mkdir(parents=True, exist_ok=True)
         final_pte = output_path / f"{model_name}_xnnpack.pte"
 
-        shutil.move(str(pte_file), str(final_pte))
+        # temp_output sits inside output_path, so this is a same-filesystem rename (no copy)
+        os.replace(pte_file, final_pte)
         file_size_mb = final_pte.stat().st_size / (1024 * 1024)
         print(f"✅ Model file: {final_pte.name} ({file_size_mb:.1f} MB)")
 
@@ -259,9 +899,12 @@ def export_gemma(model_name="gemma-3-270m", output_dir="../assets/models"):
 
         # Save simplified vocabulary for Dart
         vocab = tokenizer.get_vocab()
-        vocab_file = output_path / f"{model_name}_vocab.json"
-        with open(vocab_file, "w") as f:
-            json.dump(vocab, f, indent=2)
+        if vocab_format == "bin":
+            vocab_file = output_path / f"{model_name}_vocab.bin"
+            _write_vocab_bin(vocab_file, vocab)
+        else:
+            vocab_file = output_path / f"{model_name}_vocab.json"
+            _write_json(vocab_file, vocab)
 
         print(f"✅ Vocabulary saved: {vocab_file.name} ({len(vocab)} tokens)")
 
@@ -280,13 +923,15 @@ def export_gemma(model_name="gemma-3-270m", output_dir="../assets/models"):
         }
 
         tokenizer_config_file = output_path / f"{model_name}_tokenizer_config.json"
-        with open(tokenizer_config_file, "w") as f:
-            json.dump(tokenizer_config, f, indent=2)
+        _write_json(tokenizer_config_file, tokenizer_config)
 
         print(f"✅ Tokenizer config saved: {tokenizer_config_file.name}")
 
-        # Clean up temp directory
-        shutil.rmtree(temp_output)
+        # Clean up temp directory (rmtree only if optimum-cli left sidecar files behind)
+        try:
+            os.rmdir(temp_output)
+        except OSError:
+            shutil.rmtree(temp_output)
 
         return True
 
@@ -303,38 +948,140 @@ def export_gemma(model_name="gemma-3-270m", output_dir="../assets/models"):
         return False
 
 
-def export_labels(output_dir="../assets"):
+def export_labels(output_dir=DEFAULT_ASSETS_DIR):
     """Export COCO and ImageNet labels."""
-    print("\n" + "="*70)
-    print("  Generating Label Files")
-    print("="*70 + "\n")
-
-    # COCO labels
-    coco_labels = [
-        "person", "bicycle", "car", "motorcycle", "airplane", "bus", "train", "truck", "boat",
-        "traffic light", "fire hydrant", "stop sign", "parking meter", "bench", "bird", "cat",
-        "dog", "horse", "sheep", "cow", "elephant", "bear", "zebra", "giraffe", "backpack",
-        "umbrella", "handbag", "tie", "suitcase", "frisbee", "skis", "snowboard", "sports ball",
-        "kite", "baseball bat", "baseball glove", "skateboard", "surfboard", "tennis racket",
-        "bottle", "wine glass", "cup", "fork", "knife", "spoon", "bowl", "banana", "apple",
-        "sandwich", "orange", "broccoli", "carrot", "hot dog", "pizza", "donut", "cake", "chair",
-        "couch", "potted plant", "bed", "dining table", "toilet", "tv", "laptop", "mouse",
-        "remote", "keyboard", "cell phone", "microwave", "oven", "toaster", "sink", "refrigerator",
-        "book", "clock", "vase", "scissors", "teddy bear", "hair drier", "toothbrush"
-    ]
+    print_section("Generating Label Files")
 
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
 
     coco_file = output_path / "coco_labels.txt"
-    coco_file.write_text('\n'.join(coco_labels))
+    coco_file.write_bytes(COCO_LABELS_BYTES)
 
     print(f"✅ COCO labels: {coco_file}")
-    print(f"   ({len(coco_labels)} classes)")
+    print(f"   ({len(COCO_LABELS)} classes)")
+
+    imagenet_src = Path(__file__).with_name("imagenet_classes.txt")
+    imagenet_file = output_path / "imagenet_classes.txt"
+    if not imagenet_src.is_file():
+        print(f"⚠️  ImageNet labels not found: {imagenet_src}")
+        return
+    if not (imagenet_file.exists() and os.path.samefile(imagenet_src, imagenet_file)):
+        # Hardlink (metadata only, no byte copy); copy when crossing filesystems
+        tmp_file = imagenet_file.with_name(f"{imagenet_file.name}.{os.getpid()}.tmp")
+        try:
+            os.link(imagenet_src, tmp_file)
+        except OSError:
+            import shutil
+            shutil.copyfile(imagenet_src, tmp_file)
+        os.replace(tmp_file, imagenet_file)
+
+    print(f"✅ ImageNet labels: {imagenet_file}")
+
+
+def _run_export_task(task):
+    """Run a single export task (module-level so worker processes can unpickle it)."""
+    return task()
+
+
+def _physical_cpu_count():
+    """Physical core count (via psutil when installed), else half the logical CPUs.
+
+    SMT siblings share execution units, so torch's compute-bound export passes
+    don't get faster with more threads than physical cores.
+    """
+    try:
+        import psutil
+        count = psutil.cpu_count(logical=False)
+    except ImportError:
+        count = None
+    return max(1, count or (os.cpu_count() or 2) // 2)
+
+
+def _configure_torch(num_threads=None):
+    """Prepare this process's torch for exporting: no autograd, one warmed-up thread pool.
+
+    Grad tracking is disabled process-wide, covering model loading and warmup
+    forwards too, since nothing here ever runs backward. Sequential exports then
+    reuse the already-created pool instead of paying thread creation inside the
+    first ``torch.export`` call.
+    """
+    try:
+        import torch
+    except ImportError:
+        return  # Each export reports the missing dependency itself
+
+    torch.set_grad_enabled(False)
+    torch.set_num_threads(num_threads or _physical_cpu_count())
+    try:
+        torch.set_num_interop_threads(1)
+    except RuntimeError:
+        pass  # Only settable before inter-op work has started
+    _ = torch.randn(64, 64) @ torch.randn(64, 64)  # Force pool creation
+
+
+def _init_export_worker(num_threads, quiet):
+    """Worker process initializer: torch setup plus the parent's ``--quiet`` setting."""
+    if quiet:
+        sys.stdout = _QuietStream(sys.stdout)
+    _configure_torch(num_threads)
+
+
+def _run_export_tasks(tasks, jobs=None, quiet=False):
+    """Run independent export tasks, in parallel worker processes when possible.
+
+    Each worker gets its own interpreter (``torch.export`` holds the GIL) and an
+    intra-op thread budget of ``physical_cores // jobs`` so the pools don't oversubscribe.
+    """
+    cpu_count = _physical_cpu_count()
+    if jobs is None:
+        jobs = min(len(tasks), cpu_count)
+
+    if jobs <= 1 or len(tasks) <= 1:
+        if tasks:
+            _configure_torch()
+        return [task() for task in tasks]
+
+    print(f"\n⚡ Running {len(tasks)} exports across {jobs} worker processes")
+
+    threads_per_job = max(1, cpu_count // jobs)
+    saved_env = {var: os.environ.get(var) for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS")}
+    os.environ.update({var: str(threads_per_job) for var in saved_env})
+    try:
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=mp.get_context("spawn"),
+                                 initializer=_init_export_worker,
+                                 initargs=(threads_per_job, quiet)) as executor:
+            futures = {executor.submit(_run_export_task, task): task for task in tasks}
+            results = []
+            # Collect in completion order so one slow export doesn't hide finished ones,
+            # and a crashed worker only fails its own task
+            for future in as_completed(futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    print(f"❌ Export worker failed: {e}")
+                    results.append(False)
+            return results
+    finally:
+        for var, value in saved_env.items():
+            if value is None:
+                os.environ.pop(var, None)
+            else:
+                os.environ[var] = value
 
 
 def cmd_export(args):
     """Export command."""
+    with _quiet_stdout(args.quiet):
+        return _export_models(args)
+
+
+def _export_models(args):
+    """Body of the export command (progress output filtered by ``--quiet``)."""
+    # OpenMP/MKL read these when torch is first imported; default them to physical cores
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS"):
+        os.environ.setdefault(var, str(_physical_cpu_count()))
+
     print("""
 ╔══════════════════════════════════════════════════════════════════╗
 ║                                                                  ║
@@ -365,32 +1112,73 @@ def cmd_export(args):
     if args.yolo:
         export_yolo_models.extend(args.yolo)
 
-    # Export MobileNet
-    if export_mobilenet_flag:
-        total_count += 1
-        if export_mobilenet(args.output_dir, backends):
-            success_count += 1
+    cache_dir = None if args.no_cache else str(EXPORT_CACHE_DIR)
+    precision = "int8" if args.quantize else args.precision
+    if args.yolo_max_batch < 1:
+        print(f"❌ --yolo-max-batch must be at least 1, got {args.yolo_max_batch}")
+        return 1
 
-    # Export YOLO models
+    # An ImageNet sample folder in the environment always wins for MobileNet, so a
+    # --calibration-dir meant for YOLO (e.g. COCO frames) never calibrates it
+    imagenet_calibration_dir = os.environ.get("IMAGENET_CALIB_DIR") or None
+    mobilenet_calibration_dir = imagenet_calibration_dir or args.calibration_dir
+
+    # Check only the directories some export will actually calibrate on
+    calibration_sources = {}
+    if export_mobilenet_flag and imagenet_calibration_dir is not None:
+        calibration_sources["IMAGENET_CALIB_DIR"] = imagenet_calibration_dir
+    mobilenet_uses_flag = export_mobilenet_flag and imagenet_calibration_dir is None
+    if args.calibration_dir is not None and (export_yolo_models or mobilenet_uses_flag):
+        calibration_sources["--calibration-dir"] = args.calibration_dir
+    if precision == "int8":
+        for option, calibration_dir in calibration_sources.items():
+            try:
+                _calibration_files(calibration_dir)
+            except (OSError, ValueError) as e:
+                print(f"❌ Invalid {option}: {e}")
+                return 1
+
+    # MobileNet and YOLO exports are independent CPU-bound pipelines
+    tasks = []
+    if export_mobilenet_flag:
+        tasks.append(partial(export_mobilenet, args.output_dir, backends,
+                             precision=precision, channels_last=args.channels_last,
+                             calibration_dir=mobilenet_calibration_dir, verify=args.verify,
+                             cache_dir=cache_dir, force=args.force))
     for model_name in export_yolo_models:
-        total_count += 1
-        if export_yolo(model_name, args.output_dir, backends):
-            success_count += 1
-
-    # Export Gemma
+        tasks.append(partial(export_yolo, model_name, args.output_dir, backends,
+                             precision=precision, channels_last=args.channels_last,
+                             calibration_dir=args.calibration_dir, verify=args.verify,
+                             cache_dir=cache_dir, force=args.force,
+                             separate_outputs=args.yolo_separate_outputs,
+                             max_batch_size=args.yolo_max_batch))
+
+    # A single model would leave the pool idle: fan its backends out instead
+    if len(tasks) == 1 and args.jobs != 1:
+        tasks[0] = partial(tasks[0], backend_jobs=args.jobs or _physical_cpu_count())
+
+    results = _run_export_tasks(tasks, args.jobs, quiet=args.quiet)
+    total_count += len(results)
+    success_count += sum(1 for ok in results if ok)
+
+    # Export Gemma (kept out of the pool: optimum-cli already runs in its own process)
     if export_gemma_flag:
         total_count += 1
-        if export_gemma("gemma-3-270m", args.output_dir):
+        if export_gemma("gemma-3-270m", args.output_dir,
+                        qlinear=args.gemma_qlinear,
+                        qembedding=args.gemma_qembedding,
+                        group_size=args.gemma_group_size,
+                        use_custom_sdpa=args.use_custom_sdpa,
+                        use_custom_kv_cache=args.use_custom_kv_cache,
+                        vocab_format=args.vocab_format):
             success_count += 1
 
     # Export labels
     if args.all or args.labels:
-        export_labels("../assets")
+        export_labels(DEFAULT_ASSETS_DIR)
 
     # Summary
-    print("\n" + "="*70)
-    print("  Export Summary")
-    print("="*70)
+    print_section("Export Summary")
     print(f"\n✅ Successfully exported: {success_count}/{total_count} models")
 
     if success_count < total_count:
@@ -402,6 +1190,12 @@ def cmd_export(args):
     return 0 if success_count == total_count else 1
 
 
+def cmd_labels(args):
+    """Labels command."""
+    export_labels(args.output_dir)
+    return 0
+
+
 def cmd_validate(args):
     """Validate command."""
     print("""
@@ -412,11 +1206,17 @@ def cmd_validate(args):
 ╚══════════════════════════════════════════════════════════════════╝
 """)
 
+    # Imported here: validate_all_models pulls in torch, which export/--help don't need
+    from validate_all_models import ModelValidator
+
     # Create validator
     validator = ModelValidator(
         models_dir=args.models_dir,
         images_dir=args.images_dir,
-        assets_dir="../example/assets"
+        assets_dir=DEFAULT_ASSETS_DIR,
+        num_threads=args.threads,
+        warmup=args.warmup,
+        resize_backend=args.yolo_resize
     )
 
     # Run validation
@@ -428,12 +1228,10 @@ def cmd_validate(args):
 
     # Save results
     output_path = Path(args.output_file)
-    output_path.write_text(__import__('json').dumps(results, indent=2))
+    _write_json(output_path, results)
 
     # Print summary
-    print(f"\n{'=' * 70}")
-    print("  Validation Summary")
-    print(f"{'=' * 70}\n")
+    print_section("Validation Summary")
 
     summary = results['summary']
     print(f"✅ Total Models: {summary['total_models_tested']}")
@@ -447,8 +1245,46 @@ def cmd_validate(args):
     return 0 if summary['failed_models'] == 0 else 1
 
 
-def main():
-    """Main entry point."""
+def cmd_serve(args):
+    """Serve command: load every model once, then validate image paths read from stdin.
+
+    Each non-empty input line is an image path; each answer is one JSON line on stdout.
+    Progress and banners go to stderr so stdout stays machine-readable.
+    """
+    import json
+
+    from validate_all_models import ModelValidator
+
+    responses = sys.stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        validator = ModelValidator(
+            models_dir=args.models_dir,
+            images_dir=DEFAULT_IMAGES_DIR,
+            assets_dir=DEFAULT_ASSETS_DIR,
+            num_threads=args.threads,
+            warmup=args.warmup,
+            resize_backend=args.yolo_resize
+        )
+        models = validator.find_models()
+
+        # Parse and plan every program now, so no request pays the cold start
+        validator.preload(models)
+        print("📥 Ready: one image path per line on stdin (EOF to stop)")
+
+    for line in sys.stdin:
+        image_path = line.strip()
+        if not image_path:
+            continue
+        with contextlib.redirect_stdout(sys.stderr):
+            result = validator.validate_image(models, Path(image_path))
+        responses.write(json.dumps(result) + "\n")
+        responses.flush()
+
+    return 0
+
+
+def build_parser():
+    """Build the command-line parser for every subcommand."""
     parser = argparse.ArgumentParser(
         description="ExecuTorch Flutter - Model Export & Validation Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -460,6 +1296,9 @@ Examples:
   python main.py export --yolo yolo11n              # Export YOLO11n with all backends
   python main.py export --all --backends xnnpack    # Export all models with XNNPACK only
   python main.py export --gemma                     # Export Gemma text generation model
+  python main.py export --mobilenet --quantize      # INT8 MobileNet for XNNPACK
+  python main.py export --yolo yolo11n --precision fp16  # FP16 weights (*_fp16.pte)
+  python main.py labels                             # Generate label files only (no torch import)
   python main.py validate                           # Validate all models
 
 Supported YOLO models:
@@ -494,6 +1333,7 @@ Note: Gemma models require additional setup (advanced):
   2. Request access: https://huggingface.co/google/gemma-3-270m-it
   3. Login: hf auth login
   4. Export: python main.py export --gemma
+     Smaller/faster: python main.py export --gemma --gemma-qlinear 4w --gemma-group-size 64
         """
     )
 
@@ -503,44 +1343,99 @@ Note: Gemma models require additional setup (advanced):
     export_parser = subparsers.add_parser('export', help='Export models')
     export_parser.add_argument('--all', action='store_true', help='Export all models')
     export_parser.add_argument('--mobilenet', action='store_true', help='Export MobileNet')
-    export_parser.add_argument('--yolo', nargs='+', metavar='MODEL', help='Export YOLO model(s)')
+    export_parser.add_argument('--yolo', nargs='+', metavar='MODEL', choices=sorted(SUPPORTED_YOLO),
+                                help=f"Export YOLO model(s): {', '.join(sorted(SUPPORTED_YOLO))}")
+    export_parser.add_argument('--yolo-separate-outputs', action='store_true',
+                                help='Export YOLO with separate box/score outputs (*_split_*.pte, INT8-friendly)')
+    export_parser.add_argument('--yolo-max-batch', type=int, default=1, metavar='N',
+                                help='Export YOLO with a dynamic batch dimension accepting 1..N frames (default: 1, static)')
     export_parser.add_argument('--gemma', action='store_true', help='Export Gemma text generation model')
     export_parser.add_argument('--labels', action='store_true', help='Generate label files')
     export_parser.add_argument('--backends', nargs='+',
                                 choices=['xnnpack', 'coreml', 'mps', 'vulkan', 'qnn', 'arm'],
                                 help='Backend(s) to export for (default: xnnpack, coreml, mps, vulkan)')
-    export_parser.add_argument('--output-dir', default='../assets/models',
-                                help='Output directory (default: ../assets/models)')
+    export_parser.add_argument('--output-dir', default=DEFAULT_MODELS_DIR,
+                                help=f'Output directory (default: {DEFAULT_MODELS_DIR})')
+    export_parser.add_argument('--force', action='store_true',
+                                help='Re-export even if the .pte files are already up to date')
+    export_parser.add_argument('--no-cache', action='store_true',
+                                help=f'Always re-export instead of reusing cached programs from {EXPORT_CACHE_DIR}')
+    export_parser.add_argument('-q', '--quiet', action='store_true',
+                                help='Only print warnings and errors (exit code reports success)')
+    export_parser.add_argument('--verify', action='store_true',
+                                help='Load and run each exported .pte with the ExecuTorch runtime (XNNPACK/portable)')
+    export_parser.add_argument('--jobs', type=int, default=None,
+                                help='Parallel export processes (default: auto, 1 = serial)')
+    export_parser.add_argument('--precision', choices=['fp32', 'fp16', 'bf16', 'int8'], default='fp32',
+                                help='MobileNet/YOLO weight precision; int8 = PT2E quantization for XNNPACK (default: fp32)')
+    export_parser.add_argument('--channels-last', action='store_true',
+                                help='Trace MobileNet/YOLO in channels_last (NHWC), XNNPACK\'s native layout')
+    export_parser.add_argument('--quantize', action='store_true',
+                                help='Shorthand for --precision int8')
+    export_parser.add_argument('--calibration-dir', metavar='DIR', default=None,
+                                help=f'Images used to calibrate int8 exports (up to {CALIBRATION_MAX_IMAGES}; '
+                                     'default: random tensors). MobileNet prefers $IMAGENET_CALIB_DIR when set')
+    export_parser.add_argument('--gemma-qlinear', choices=['8da4w', '4w', 'none'], default='8da4w',
+                                help='Gemma linear quantization (default: 8da4w)')
+    export_parser.add_argument('--gemma-qembedding', choices=['8w', '4w', 'none'], default='8w',
+                                help='Gemma embedding quantization (default: 8w)')
+    export_parser.add_argument('--gemma-group-size', type=int, default=32,
+                                help='Group size for int4 Gemma linear weights (default: 32)')
+    export_parser.add_argument('--use-custom-sdpa', action='store_true',
+                                help='Use ExecuTorch custom SDPA op for Gemma (if supported)')
+    export_parser.add_argument('--use-custom-kv-cache', action='store_true',
+                                help='Use ExecuTorch custom KV cache for Gemma (if supported)')
+    export_parser.add_argument('--vocab-format', choices=['json', 'bin'], default='json',
+                                help='Gemma vocabulary format: json map or compact GVCB binary (default: json)')
+    export_parser.set_defaults(func=cmd_export)
 
     # Validate command
     validate_parser = subparsers.add_parser('validate', help='Validate models')
-    validate_parser.add_argument('--models-dir', default='../assets/models',
-                                  help='Models directory (default: ../assets/models)')
-    validate_parser.add_argument('--images-dir', default='../assets/images',
-                                  help='Test images directory (default: ../assets/images)')
-    validate_parser.add_argument('--output-file', default='../assets/model_test_results.json',
-                                  help='Output file (default: ../assets/model_test_results.json)')
+    validate_parser.add_argument('--models-dir', default=DEFAULT_MODELS_DIR,
+                                  help=f'Models directory (default: {DEFAULT_MODELS_DIR})')
+    validate_parser.add_argument('--images-dir', default=DEFAULT_IMAGES_DIR,
+                                  help=f'Test images directory (default: {DEFAULT_IMAGES_DIR})')
+    validate_parser.add_argument('--output-file', default=DEFAULT_RESULTS_FILE,
+                                  help=f'Output file (default: {DEFAULT_RESULTS_FILE})')
+    validate_parser.add_argument('--threads', type=int, default=None,
+                                  help='ExecuTorch CPU threadpool size (default: min(4, CPU count))')
+    validate_parser.add_argument('--warmup', action='store_true',
+                                  help='Run one untimed inference per model before timing test images')
+    validate_parser.add_argument('--yolo-resize', choices=['pillow', 'opencv'], default='pillow',
+                                  help='YOLO letterbox resize backend, recorded in the results (default: pillow)')
+    validate_parser.set_defaults(func=cmd_validate)
+
+    # Serve command: keep models loaded between inference requests
+    serve_parser = subparsers.add_parser('serve', help='Keep models loaded and validate image paths from stdin')
+    serve_parser.add_argument('--models-dir', default=DEFAULT_MODELS_DIR,
+                               help=f'Models directory (default: {DEFAULT_MODELS_DIR})')
+    serve_parser.add_argument('--threads', type=int, default=None,
+                               help='ExecuTorch CPU threadpool size (default: min(4, CPU count))')
+    serve_parser.add_argument('--warmup', action='store_true',
+                               help='Run one inference per model at startup, before the first request')
+    serve_parser.add_argument('--yolo-resize', choices=['pillow', 'opencv'], default='pillow',
+                               help='YOLO letterbox resize backend, recorded in the results (default: pillow)')
+    serve_parser.set_defaults(func=cmd_serve)
+
+    # Labels command (pure Python, never imports torch)
+    labels_parser = subparsers.add_parser('labels', help='Generate label files')
+    labels_parser.add_argument('--output-dir', default=DEFAULT_ASSETS_DIR,
+                                help=f'Output directory (default: {DEFAULT_ASSETS_DIR})')
+    labels_parser.set_defaults(func=cmd_labels)
+
+    return parser
+
 
+def main():
+    """Main entry point."""
+    parser = build_parser()
     args = parser.parse_args()
 
-    # Default to export if no command specified
+    # Default to exporting all models and labels if no command specified
     if args.command is None:
-        args.command = 'export'
-        args.all = True
-        args.mobilenet = False
-        args.yolo = None
-        args.gemma = False
-        args.labels = True
-        args.output_dir = '../assets/models'
-
-    # Run command
-    if args.command == 'export':
-        return cmd_export(args)
-    elif args.command == 'validate':
-        return cmd_validate(args)
-    else:
-        parser.print_help()
-        return 1
+        args = parser.parse_args(['export', '--all', '--labels'])
+
+    return args.func(args)
 
 
 if __name__ == "__main__":
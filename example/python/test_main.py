@@ -0,0 +1,184 @@
+"""Smoke tests for the main.py command line (no torch/ExecuTorch needed)."""
+
+import os
+import struct
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+import pytest
+
+import main
+
+
+@pytest.mark.parametrize("argv,func", [
+    (["export", "--all", "--labels"], main.cmd_export),
+    (["export", "--yolo", "yolo11n", "--yolo-max-batch", "4", "--verify"], main.cmd_export),
+    (["validate", "--threads", "2", "--warmup"], main.cmd_validate),
+    (["serve", "--threads", "2", "--warmup"], main.cmd_serve),
+    (["validate", "--yolo-resize", "opencv"], main.cmd_validate),
+    (["labels", "--output-dir", "out"], main.cmd_labels),
+])
+def test_subcommands_parse(argv, func):
+    args = main.build_parser().parse_args(argv)
+    assert args.command == argv[0]
+    assert args.func is func
+
+
+def test_help_exits_cleanly(capsys):
+    with pytest.raises(SystemExit) as exc:
+        main.build_parser().parse_args(["--help"])
+    assert exc.value.code == 0
+    assert "serve" in capsys.readouterr().out
+
+
+def test_labels_command_writes_files(tmp_path):
+    args = main.build_parser().parse_args(["labels", "--output-dir", str(tmp_path)])
+    args.func(args)
+    assert (tmp_path / "coco_labels.txt").read_text().splitlines()[0] == "person"
+    assert (tmp_path / "imagenet_classes.txt").exists()
+
+
+@pytest.fixture
+def export_cache(tmp_path, monkeypatch):
+    """Point export manifests at a temporary cache dir."""
+    monkeypatch.setattr(main, "EXPORT_CACHE_DIR", tmp_path / "cache")
+    return tmp_path
+
+
+def _record(output_dir, path, fingerprint, backends=("xnnpack",)):
+    result = SimpleNamespace(success=True, output_path=str(path))
+    main._record_export(output_dir, "model", list(backends), fingerprint, [result])
+
+
+def test_unchanged_output_is_up_to_date(export_cache):
+    pte = export_cache / "model_xnnpack.pte"
+    pte.write_bytes(b"\0\0\0\0ET12program")
+    fingerprint = {"precision": "fp32", "channels_last": False}
+    _record(export_cache, pte, fingerprint)
+    assert main._is_up_to_date(export_cache, "model", ["xnnpack"], fingerprint)
+    assert not main._is_up_to_date(export_cache, "model", ["xnnpack", "coreml"], fingerprint)
+
+
+def test_touched_output_with_same_bytes_is_up_to_date(export_cache):
+    pte = export_cache / "model_xnnpack.pte"
+    pte.write_bytes(b"\0\0\0\0ET12program")
+    fingerprint = {"precision": "fp32", "channels_last": False}
+    _record(export_cache, pte, fingerprint)
+    st = pte.stat()
+    os.utime(pte, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert main._is_up_to_date(export_cache, "model", ["xnnpack"], fingerprint)
+
+
+def test_changed_output_bytes_are_stale(export_cache):
+    pte = export_cache / "model_xnnpack.pte"
+    pte.write_bytes(b"\0\0\0\0ET12program")
+    fingerprint = {"precision": "fp32", "channels_last": False}
+    _record(export_cache, pte, fingerprint)
+    st = pte.stat()
+    pte.write_bytes(b"\0\0\0\0ET12PROGRAM")  # Same size, different bytes
+    os.utime(pte, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+    assert not main._is_up_to_date(export_cache, "model", ["xnnpack"], fingerprint)
+
+
+def test_precisions_are_tracked_separately(export_cache):
+    fp32 = {"precision": "fp32", "channels_last": False}
+    int8 = {"precision": "int8", "channels_last": False}
+    (export_cache / "model_xnnpack.pte").write_bytes(b"fp32")
+    (export_cache / "model_xnnpack_int8.pte").write_bytes(b"int8")
+    _record(export_cache, export_cache / "model_xnnpack.pte", fp32)
+    _record(export_cache, export_cache / "model_xnnpack_int8.pte", int8)
+    assert main._is_up_to_date(export_cache, "model", ["xnnpack"], fp32)
+    assert main._is_up_to_date(export_cache, "model", ["xnnpack"], int8)
+
+
+@dataclass
+class _StubConfig:
+    precision: str
+    backends: list
+    output_dir: str
+
+
+class _StubExporter:
+    """Lowers every backend ``half_failures`` names to a failure in half precision."""
+
+    def __init__(self, half_failures):
+        self.half_failures = set(half_failures)
+
+    @staticmethod
+    def _output_filename(config, backend):
+        suffix = "" if config.precision == "fp32" else f"_{config.precision}"
+        return f"model_{backend}{suffix}.pte"
+
+    def _results(self, config):
+        results = []
+        for backend in config.backends:
+            path = os.path.join(config.output_dir, self._output_filename(config, backend))
+            if config.precision != "fp32" and backend in self.half_failures:
+                results.append(SimpleNamespace(backend=backend, success=False, output_path="",
+                                               error_message="unsupported dtype"))
+                continue
+            with open(path, "wb") as f:
+                f.write(config.precision.encode())
+            results.append(SimpleNamespace(backend=backend, success=True, output_path=path,
+                                           file_size_mb=0.0))
+        return results
+
+    def prepare_export(self, model, sample_inputs, config):
+        return config
+
+    def lower_prepared(self, prepared):
+        return self._results(prepared)
+
+    def export_model(self, model, sample_inputs, config):
+        return self._results(config)
+
+
+def test_fp32_fallback_is_not_recorded_as_up_to_date(export_cache):
+    fingerprint = {"precision": "fp16", "channels_last": False}
+    config = _StubConfig(precision="fp16", backends=["xnnpack", "coreml"], output_dir=str(export_cache))
+    results, fallback = main._export_with_fallback(_StubExporter({"coreml"}), object, (), config)
+
+    assert fallback == ["coreml"]
+    assert all(r.success for r in results)
+    assert (export_cache / "model_coreml.pte").read_bytes() == b"fp32"
+    assert main._report_export(export_cache, "model", config.backends, fingerprint, results, fallback)
+    assert not main._is_up_to_date(export_cache, "model", config.backends, fingerprint)
+
+
+def test_clean_half_precision_export_is_recorded(export_cache):
+    fingerprint = {"precision": "fp16", "channels_last": False}
+    config = _StubConfig(precision="fp16", backends=["xnnpack"], output_dir=str(export_cache))
+    results, fallback = main._export_with_fallback(_StubExporter(()), object, (), config)
+
+    assert fallback == []
+    assert main._report_export(export_cache, "model", config.backends, fingerprint, results, fallback)
+    assert main._is_up_to_date(export_cache, "model", config.backends, fingerprint)
+
+
+def _read_vocab_bin(data):
+    """Parse a GVCB file back into ``{token: id}``, checking the layout byte for byte."""
+    assert data[:4] == b"GVCB"
+    (count,) = struct.unpack_from("<I", data, 4)
+    offset, vocab = 8, {}
+    for _ in range(count):
+        idx, length = struct.unpack_from("<IH", data, offset)
+        offset += struct.calcsize("<IH")
+        vocab[data[offset:offset + length].decode("utf-8")] = idx
+        offset += length
+    assert offset == len(data)
+    return vocab
+
+
+def test_vocab_bin_round_trips(tmp_path):
+    vocab = {"<pad>": 0, "hello": 2, "▁wörld": 1, "": 3, "🙂": 70000}
+    path = tmp_path / "vocab.bin"
+    main._write_vocab_bin(path, vocab)
+    data = path.read_bytes()
+    assert _read_vocab_bin(data) == vocab
+    # Entries are written in id order
+    assert data.index("▁wörld".encode()) < data.index(b"hello")
+
+
+def test_vocab_bin_rejects_overlong_tokens(tmp_path):
+    with pytest.raises(ValueError, match="u16"):
+        main._write_vocab_bin(tmp_path / "vocab.bin", {"x" * 65536: 7})
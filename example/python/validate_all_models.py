@@ -14,15 +14,133 @@ Usage:
     python validate_all_models.py
 """
 
+import os
+import threading
 import torch
 import numpy as np
 from pathlib import Path
 from PIL import Image
 import json
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Dict, Tuple, Optional
+from functools import lru_cache, partial
+from typing import Callable, List, Dict, Tuple, Optional, Union
 import time
 
+from _coco import COCO_LABELS
+
+try:
+    import numba  # Optional: fused single-pass ImageNet normalization
+except ImportError:
+    numba = None
+
+try:
+    import cv2  # Optional: SIMD bilinear resize for the YOLO letterbox
+except ImportError:
+    cv2 = None
+
+# ExecuTorch CPU threadpool size: past ~4 threads small models like MobileNet get slower
+DEFAULT_RUNTIME_THREADS = min(4, os.cpu_count() or 1)
+
+# Threads decoding/resizing images ahead of inference (PIL and the runtime release the GIL)
+PREPROCESS_WORKERS = 2
+
+# Section banner pieces, built once
+_BAR70 = "=" * 70
+_SECTION_FMT = f"\n{_BAR70}\n  {{}}\n{_BAR70}\n"
+
+
+def print_section(title: str) -> None:
+    """Print a section banner."""
+    print(_SECTION_FMT.format(title))
+
+
+def _configure_runtime_threads(num_threads: int) -> None:
+    """Resize the ExecuTorch CPU threadpool (used by XNNPACK) that ``method.execute`` runs on."""
+    try:
+        from executorch.extension.pybindings.portable_lib import _unsafe_reset_threadpool
+    except ImportError:
+        return  # Runtime without the hook: keep its default of one thread per core
+    _unsafe_reset_threadpool(num_threads)
+
+
+@lru_cache(maxsize=None)
+def _load_method(model_path: str):
+    """Load a .pte's ``forward`` method once per path.
+
+    Returns ``(program, method)``; the program is kept alive alongside its method,
+    so re-validating a model reuses the parsed program and its memory planning.
+    The path is passed through as-is (never the file's bytes) so the runtime
+    mmaps the .pte rather than reading a heap copy of it.
+    """
+    from executorch.runtime import Runtime
+
+    program = Runtime.get().load_program(model_path)
+    return program, program.load_method("forward")
+
+
+# Per-channel constants shaped (3, 1, 1) to broadcast over CHW images
+IMAGENET_MEAN = np.array([0.485, 0.456, 0.406], dtype=np.float32).reshape(3, 1, 1)
+IMAGENET_STD = np.array([0.229, 0.224, 0.225], dtype=np.float32).reshape(3, 1, 1)
+YOLO_PAD_VALUE = 114 / 255.0
+
+# (x / 255 - mean) / std folded into one multiply-add: x * NORM_SCALE + NORM_BIAS
+IMAGENET_NORM_SCALE = (1.0 / (255.0 * IMAGENET_STD)).astype(np.float32)
+IMAGENET_NORM_BIAS = (-IMAGENET_MEAN / IMAGENET_STD).astype(np.float32)
+
+# The same multiply-add evaluated for every uint8 value: [3, 256] per-channel lookup tables
+IMAGENET_NORM_LUT = (np.arange(256, dtype=np.float32) * IMAGENET_NORM_SCALE.reshape(3, 1)
+                     + IMAGENET_NORM_BIAS.reshape(3, 1))
+
+
+def _normalize_hwc_numpy(hwc: np.ndarray, out_chw: np.ndarray) -> None:
+    """Write ``hwc`` (uint8) into ``out_chw`` (float32) as ImageNet-normalized CHW."""
+    # One gather per channel straight into the output plane; mode='clip' avoids take()'s
+    # buffered copy of ``out`` (uint8 indices can never be out of range anyway)
+    for c in range(3):
+        np.take(IMAGENET_NORM_LUT[c], hwc[:, :, c], out=out_chw[c], mode='clip')
+
+
+if numba is not None:
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _normalize_hwc_numba(hwc, scale, bias, out_chw):
+        # One read of the uint8 pixels, one write of the float32 CHW output
+        height, width, channels = hwc.shape
+        for c in numba.prange(channels):
+            for y in range(height):
+                for x in range(width):
+                    out_chw[c, y, x] = hwc[y, x, c] * scale[c] + bias[c]
+
+    # Numba's default (workqueue) threading layer aborts on concurrent calls into a parallel
+    # kernel, and preprocessing runs on several threads; the kernel already uses every core
+    _NORMALIZE_NUMBA_LOCK = threading.Lock()
+
+    def _normalize_hwc(hwc: np.ndarray, out_chw: np.ndarray) -> None:
+        """Write ``hwc`` (uint8) into ``out_chw`` (float32) as ImageNet-normalized CHW."""
+        with _NORMALIZE_NUMBA_LOCK:
+            _normalize_hwc_numba(hwc, IMAGENET_NORM_SCALE.ravel(), IMAGENET_NORM_BIAS.ravel(), out_chw)
+else:
+    _normalize_hwc = _normalize_hwc_numpy
+
+
+def _open_rgb(image: Union[str, np.ndarray]) -> Image.Image:
+    """Open ``image`` (a path, or an already decoded uint8 HWC RGB array) as an RGB PIL image."""
+    if isinstance(image, np.ndarray):
+        return Image.fromarray(image)
+    return Image.open(image).convert('RGB')
+
+
+# YOLO letterbox resize implementations; results differ slightly (Pillow antialiases, OpenCV doesn't)
+RESIZE_BACKENDS = ("pillow", "opencv")
+
+
+def _resize_bilinear(pixels: np.ndarray, size: Tuple[int, int], backend: str = "pillow") -> np.ndarray:
+    """Resize uint8 HWC ``pixels`` to ``size`` (width, height) with the given ``RESIZE_BACKENDS`` entry."""
+    if backend == "opencv":
+        # Same INTER_LINEAR letterbox resize Ultralytics uses when training/predicting
+        return cv2.resize(pixels, size, interpolation=cv2.INTER_LINEAR)
+    return np.asarray(Image.fromarray(pixels).resize(size, Image.Resampling.BILINEAR))
+
 
 class ImageNetPreprocessor:
     """Preprocess images for ImageNet models (MobileNet)."""
@@ -32,32 +150,56 @@ class ImageNetPreprocessor:
         """
         Preprocess image for ImageNet models.
 
-        Uses torchvision's standard preprocessing pipeline:
+        Args:
+            image_path: Path to input image
+            target_size: Target size (default 224 for MobileNet)
+
+        Returns:
+            Preprocessed tensor [1, 3, H, W]
+        """
+        return ImageNetPreprocessor.preprocess_batch([image_path], target_size)
+
+    @staticmethod
+    def preprocess_batch(images: List[Union[str, np.ndarray]], target_size: int = 224,
+                         out: Optional[np.ndarray] = None) -> torch.Tensor:
+        """
+        Preprocess images for ImageNet models into one batch.
+
+        Matches torchvision's standard preprocessing pipeline (without importing it):
         1. Resize shortest edge to 256 (maintaining aspect ratio)
         2. Center crop to 224x224
         3. Normalize with ImageNet mean/std
 
         Args:
-            image_path: Path to input image
+            images: Image paths, or already decoded uint8 HWC RGB arrays
             target_size: Target size (default 224 for MobileNet)
+            out: Optional float32 [N, 3, H, W] buffer to fill instead of allocating
 
         Returns:
-            Preprocessed tensor [1, 3, H, W]
+            Preprocessed tensor [N, 3, H, W] sharing memory with one NumPy buffer
         """
-        from torchvision import transforms
+        if out is None:
+            out = np.empty((len(images), 3, target_size, target_size), dtype=np.float32)
+
+        for i, image in enumerate(images):
+            img = _open_rgb(image)
+
+            # Resize shorter edge to 256, maintaining aspect ratio (transforms.Resize(256))
+            width, height = img.size
+            short, long = min(width, height), max(width, height)
+            resized = (256, int(256 * long / short))
+            new_width, new_height = resized if width <= height else resized[::-1]
+            img = img.resize((new_width, new_height), Image.Resampling.BILINEAR)
 
-        img = Image.open(image_path).convert('RGB')
+            # Then center crop to target_size x target_size (transforms.CenterCrop)
+            left = int(round((new_width - target_size) / 2.0))
+            top = int(round((new_height - target_size) / 2.0))
+            img = img.crop((left, top, left + target_size, top + target_size))
 
-        # Use torchvision's standard preprocessing (same as training)
-        preprocess = transforms.Compose([
-            transforms.Resize(256),  # Resize shorter edge to 256, maintaining aspect ratio
-            transforms.CenterCrop(target_size),  # Then center crop to target_size x target_size
-            transforms.ToTensor(),  # Convert to [0, 1] and CHW format
-            transforms.Normalize(mean=[0.485, 0.456, 0.406], std=[0.229, 0.224, 0.225]),
-        ])
+            # [0, 1] CHW and normalize in place (transforms.ToTensor + Normalize)
+            _normalize_hwc(np.asarray(img, dtype=np.uint8), out[i])
 
-        img_tensor = preprocess(img).unsqueeze(0)
-        return img_tensor.float()
+        return torch.from_numpy(out)
 
 
 class YOLOPreprocessor:
@@ -73,46 +215,74 @@ class YOLOPreprocessor:
             target_size: Target size (default 640 for YOLO)
 
         Returns:
-            Tuple of (preprocessed tensor, metadata)
+            Tuple of (preprocessed tensor [1, 3, H, W], metadata)
         """
-        img = Image.open(image_path).convert('RGB')
-        original_width, original_height = img.size
-
-        # Letterbox resize
-        scale = min(target_size / original_width, target_size / original_height)
-        new_width = int(original_width * scale)
-        new_height = int(original_height * scale)
-
-        # Resize image
-        img = img.resize((new_width, new_height), Image.Resampling.BILINEAR)
-
-        # Create canvas with gray padding
-        canvas = Image.new('RGB', (target_size, target_size), (114, 114, 114))
-        offset_x = (target_size - new_width) // 2
-        offset_y = (target_size - new_height) // 2
-        canvas.paste(img, (offset_x, offset_y))
-
-        # Convert to tensor
-        img_array = np.array(canvas).astype(np.float32) / 255.0
-        img_tensor = torch.from_numpy(img_array).permute(2, 0, 1).unsqueeze(0)
-
-        # Metadata for coordinate transformation
-        metadata = {
-            'original_width': original_width,
-            'original_height': original_height,
-            'scale': scale,
-            'offset_x': offset_x,
-            'offset_y': offset_y,
-            'target_size': target_size
-        }
+        batch, metadata = YOLOPreprocessor.preprocess_batch([image_path], target_size)
+        return batch, metadata[0]
 
-        return img_tensor.float(), metadata
+    @staticmethod
+    def preprocess_batch(images: List[Union[str, np.ndarray]], target_size: int = 640,
+                         out: Optional[np.ndarray] = None,
+                         resize_backend: str = "pillow") -> Tuple[torch.Tensor, List[Dict]]:
+        """
+        Letterbox images for YOLO models into one batch.
+
+        Args:
+            images: Image paths, or already decoded uint8 HWC RGB arrays
+            target_size: Target size (default 640 for YOLO)
+            out: Optional float32 [N, 3, H, W] buffer to fill instead of allocating
+            resize_backend: "pillow" (default) or "opencv" (requires opencv-python)
+
+        Returns:
+            Tuple of (preprocessed tensor [N, 3, H, W], per-image metadata)
+        """
+        # Gray padding is filled once for the whole batch; each image overwrites its own region
+        if out is None:
+            out = np.full((len(images), 3, target_size, target_size), YOLO_PAD_VALUE, dtype=np.float32)
+        else:
+            out.fill(YOLO_PAD_VALUE)
+        all_metadata = []
+
+        for i, image in enumerate(images):
+            pixels = image if isinstance(image, np.ndarray) else np.asarray(_open_rgb(image))
+            original_height, original_width = pixels.shape[:2]
+
+            # Letterbox resize
+            scale = min(target_size / original_width, target_size / original_height)
+            new_width = int(original_width * scale)
+            new_height = int(original_height * scale)
+
+            # Resize image
+            resized = _resize_bilinear(pixels, (new_width, new_height), resize_backend)
+
+            # Paste into the padded canvas, converting to [0, 1] CHW
+            offset_x = (target_size - new_width) // 2
+            offset_y = (target_size - new_height) // 2
+            region = out[i, :, offset_y:offset_y + new_height, offset_x:offset_x + new_width]
+            np.multiply(resized.transpose(2, 0, 1), 1 / 255.0, out=region)
+
+            # Metadata for coordinate transformation
+            all_metadata.append({
+                'original_width': original_width,
+                'original_height': original_height,
+                'scale': scale,
+                'offset_x': offset_x,
+                'offset_y': offset_y,
+                'target_size': target_size
+            })
+
+        return torch.from_numpy(out), all_metadata
+
+
+def _class_name(labels: Tuple[str, ...], class_idx: int) -> str:
+    """Label for ``class_idx``, or a "Class N" placeholder past the end of ``labels``."""
+    return labels[class_idx] if class_idx < len(labels) else f"Class {class_idx}"
 
 
 class YOLOPostprocessor:
     """Postprocess YOLO outputs with NMS."""
 
-    def __init__(self, class_labels: List[str], conf_threshold: float = 0.25, iou_threshold: float = 0.45):
+    def __init__(self, class_labels: Tuple[str, ...], conf_threshold: float = 0.25, iou_threshold: float = 0.45):
         self.class_labels = class_labels
         self.conf_threshold = conf_threshold
         self.iou_threshold = iou_threshold
@@ -147,66 +317,37 @@ class YOLOPostprocessor:
         is_yolov5 = num_features == 85  # YOLOv5: 4 bbox + 1 objectness + 80 classes
         num_classes = 80 if is_yolov5 else (num_features - 4)
 
-        detections = []
-
-        for i in range(num_predictions):
-            # Extract values based on format
-            if is_transposed:
-                x_center = output[0, 0, i]
-                y_center = output[0, 1, i]
-                width = output[0, 2, i]
-                height = output[0, 3, i]
-                objectness = output[0, 4, i] if is_yolov5 else 1.0
-
-                # Get class scores
-                class_start = 5 if is_yolov5 else 4
-                class_scores = output[0, class_start:class_start + num_classes, i]
-            else:
-                x_center = output[0, i, 0]
-                y_center = output[0, i, 1]
-                width = output[0, i, 2]
-                height = output[0, i, 3]
-                objectness = output[0, i, 4] if is_yolov5 else 1.0
-
-                # Get class scores
-                class_start = 5 if is_yolov5 else 4
-                class_scores = output[0, i, class_start:class_start + num_classes]
-
-            # Find best class
-            best_class_idx = np.argmax(class_scores)
-            best_class_conf = class_scores[best_class_idx]
-
-            # Calculate final confidence
-            confidence = objectness * best_class_conf if is_yolov5 else best_class_conf
-
-            # Filter by confidence threshold
-            if confidence < self.conf_threshold:
-                continue
-
-            # Convert to corner coordinates (normalized 0-1)
-            x1 = (x_center - width / 2)
-            y1 = (y_center - height / 2)
-            x2 = (x_center + width / 2)
-            y2 = (y_center + height / 2)
+        # View the output as [features, predictions] (a transpose view, never a copy)
+        preds = output[0] if is_transposed else output[0].T
+        class_start = 5 if is_yolov5 else 4
+        class_scores = preds[class_start:class_start + num_classes]
+
+        # Score and threshold all predictions at once; only survivors reach Python
+        best_class = class_scores.argmax(axis=0)
+        scores = class_scores.max(axis=0)
+        if is_yolov5:
+            scores = preds[4] * scores
+        candidates = np.flatnonzero(scores >= self.conf_threshold)
+
+        # Corner coordinates (normalized 0-1), clamped to [0, 1]
+        x_center, y_center, width, height = preds[:4, candidates]
+        corners = np.clip(
+            np.stack([x_center - width / 2, y_center - height / 2, x_center + width / 2, y_center + height / 2]),
+            0.0, 1.0
+        )
 
-            # Clamp to [0, 1]
-            x1 = max(0.0, min(1.0, x1))
-            y1 = max(0.0, min(1.0, y1))
-            x2 = max(0.0, min(1.0, x2))
-            y2 = max(0.0, min(1.0, y2))
+        detections = []
 
-            class_name = self.class_labels[best_class_idx] if best_class_idx < len(self.class_labels) else f"Class {best_class_idx}"
+        for best_class_idx, confidence, (x1, y1, x2, y2) in zip(
+            best_class[candidates].tolist(), scores[candidates].tolist(), corners.T.tolist()
+        ):
+            class_name = _class_name(self.class_labels, best_class_idx)
 
             detections.append({
                 'class': class_name,
-                'class_index': int(best_class_idx),
-                'confidence': float(confidence),
-                'bbox_normalized': {
-                    'x1': float(x1),
-                    'y1': float(y1),
-                    'x2': float(x2),
-                    'y2': float(y2)
-                },
+                'class_index': best_class_idx,
+                'confidence': confidence,
+                'bbox_normalized': {'x1': x1, 'y1': y1, 'x2': x2, 'y2': y2},
                 'bbox_pixel': self._to_pixel_coords(
                     x1, y1, x2, y2,
                     metadata['original_width'],
@@ -314,24 +455,95 @@ class YOLOPostprocessor:
 class ModelValidator:
     """Validate all ExecuTorch models."""
 
-    def __init__(self, models_dir: str, images_dir: str, assets_dir: str):
+    def __init__(self, models_dir: str, images_dir: str, assets_dir: str,
+                 num_threads: Optional[int] = None, warmup: bool = False,
+                 resize_backend: str = "pillow"):
+        if resize_backend not in RESIZE_BACKENDS:
+            raise ValueError(f"resize_backend must be one of {RESIZE_BACKENDS}, got {resize_backend!r}")
+        if resize_backend == "opencv" and cv2 is None:
+            raise ImportError("resize_backend='opencv' requires opencv-python (pip install opencv-python)")
         self.models_dir = Path(models_dir)
+        self.warmup = warmup
+        self.resize_backend = resize_backend
         self.images_dir = Path(images_dir)
         self.assets_dir = Path(assets_dir)
 
         # Load labels
         self.imagenet_labels = self._load_labels(self.assets_dir / "imagenet_classes.txt")
-        self.coco_labels = self._load_labels(self.assets_dir / "coco_labels.txt")
+        # COCO labels are bundled in _coco; the asset file only wins if present
+        self.coco_labels = self._load_labels(self.assets_dir / "coco_labels.txt", COCO_LABELS)
 
         print(f"📋 Loaded {len(self.imagenet_labels)} ImageNet labels")
         print(f"📋 Loaded {len(self.coco_labels)} COCO labels")
 
-    def _load_labels(self, path: Path) -> List[str]:
-        """Load class labels from file."""
-        if not path.exists():
+        # Input batches reused by every model of the same input size
+        self._input_buffers: Dict[Tuple[int, ...], np.ndarray] = {}
+        self._preprocess_pool = ThreadPoolExecutor(max_workers=PREPROCESS_WORKERS)
+        # Test images decoded once and shared by the classification and detection passes
+        self._decoded_images: Dict[Path, np.ndarray] = {}
+        # Models whose (cached) method already ran its warmup inference
+        self._warmed_up = set()
+
+        _configure_runtime_threads(num_threads or DEFAULT_RUNTIME_THREADS)
+
+    def _method(self, model_path: Path, input_size: int):
+        """Load ``model_path``'s forward method; with ``warmup``, first run one discarded inference.
+
+        The warmup keeps one-time costs of the first execute (e.g. XNNPACK kernel setup)
+        out of the first test image's timing.
+        """
+        _, method = _load_method(str(model_path))
+        if self.warmup and model_path not in self._warmed_up:
+            method.execute((torch.zeros(1, 3, input_size, input_size),))
+            self._warmed_up.add(model_path)
+        return method
+
+    def preload(self, models: Dict[str, List[Path]]) -> None:
+        """Load (and warm up, if enabled) every model in ``models`` ahead of the first image."""
+        for category, input_size in (('classification', 224), ('detection', 640)):
+            for model_path in models[category]:
+                try:
+                    self._method(model_path, input_size)
+                except Exception as e:
+                    print(f"⚠️  Could not load {model_path.name}: {e}")
+
+    def _input_buffer(self, num_images: int, target_size: int) -> np.ndarray:
+        """Shared float32 [N, 3, S, S] input buffer, allocated on first use."""
+        shape = (num_images, 3, target_size, target_size)
+        if shape not in self._input_buffers:
+            self._input_buffers[shape] = np.empty(shape, dtype=np.float32)
+        return self._input_buffers[shape]
+
+    def _preprocess_ahead(self, preprocess_batch: Callable, test_images: List[Tuple[str, Path]],
+                          target_size: int) -> List[Future]:
+        """Preprocess each test image on a worker thread into its slot of the shared input buffer.
+
+        Futures resolve in image order, so inference on image i overlaps with preprocessing of
+        the images after it; only preprocessing runs concurrently, never ``method.execute``.
+        """
+        buffer = self._input_buffer(len(test_images), target_size)
+
+        def preprocess(i: int, path: Path):
+            return preprocess_batch([self._decoded_image(path)], target_size, out=buffer[i:i + 1])
+
+        return [self._preprocess_pool.submit(preprocess, i, path) for i, (_, path) in enumerate(test_images)]
+
+    def _decoded_image(self, path: Path) -> np.ndarray:
+        """Decode ``path`` to a uint8 HWC RGB array once; every later model reuses the pixels."""
+        if path not in self._decoded_images:
+            with Image.open(path) as img:
+                self._decoded_images[path] = np.asarray(img.convert('RGB'))
+        return self._decoded_images[path]
+
+    def _load_labels(self, path: Path, default: Tuple[str, ...] = ()) -> Tuple[str, ...]:
+        """Load class labels from file, or ``default`` when the file is missing."""
+        if path.exists():
+            return tuple(path.read_text().strip().split('\n'))
+        if default:
+            print(f"⚠️  Labels not found: {path} (using {len(default)} bundled labels)")
+        else:
             print(f"⚠️  Labels not found: {path}")
-            return []
-        return path.read_text().strip().split('\n')
+        return default
 
     def find_models(self) -> Dict[str, List[Path]]:
         """Find all available model files."""
@@ -340,17 +552,29 @@ class ModelValidator:
             'detection': []
         }
 
-        if not self.models_dir.exists():
+        # One directory listing; DirEntry caches the file type and stat results
+        try:
+            with os.scandir(self.models_dir) as it:
+                entries = sorted((e for e in it if e.name.endswith(".pte") and e.is_file()),
+                                 key=lambda e: e.name)
+        except FileNotFoundError:
             print(f"⚠️  Models directory not found: {self.models_dir}")
             return models
 
-        for model_file in self.models_dir.glob("*.pte"):
-            name = model_file.stem.lower()
+        total_bytes = 0
+        for entry in entries:
+            name = entry.name[:-len(".pte")].lower()
 
             if 'mobilenet' in name or 'resnet' in name or 'efficientnet' in name:
-                models['classification'].append(model_file)
+                models['classification'].append(Path(entry.path))
             elif 'yolo' in name:
-                models['detection'].append(model_file)
+                models['detection'].append(Path(entry.path))
+            else:
+                continue
+            total_bytes += entry.stat().st_size
+
+        if total_bytes:
+            print(f"📦 Model files total {total_bytes / (1024 * 1024):.1f} MB")
 
         return models
 
@@ -358,29 +582,24 @@ class ModelValidator:
         """Find all test images."""
         images = []
 
-        if not self.images_dir.exists():
+        try:
+            with os.scandir(self.images_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".jpg") and entry.is_file():
+                        images.append((entry.name[:-len(".jpg")].capitalize(), Path(entry.path)))
+        except FileNotFoundError:
             print(f"⚠️  Images directory not found: {self.images_dir}")
             return images
 
-        for img_path in self.images_dir.glob("*.jpg"):
-            name = img_path.stem.capitalize()
-            images.append((name, img_path))
-
         images.sort(key=lambda x: x[0])
         return images
 
     def validate_classification_model(self, model_path: Path, test_images: List[Tuple[str, Path]]) -> Dict:
         """Validate a classification model."""
-        print(f"\n{'=' * 70}")
-        print(f"  Testing Classification Model: {model_path.name}")
-        print(f"{'=' * 70}\n")
+        print_section(f"Testing Classification Model: {model_path.name}")
 
         try:
-            from executorch.runtime import Runtime
-
-            runtime = Runtime.get()
-            program = runtime.load_program(str(model_path))
-            method = program.load_method("forward")
+            method = self._method(model_path, 224)
 
             results = {
                 'model_name': model_path.stem,
@@ -391,39 +610,45 @@ class ModelValidator:
                 'test_results': {}
             }
 
-            preprocessor = ImageNetPreprocessor()
+            # Preprocess in the background while earlier images run through the model
+            pending = self._preprocess_ahead(ImageNetPreprocessor.preprocess_batch, test_images, 224)
 
-            for img_name, img_path in test_images:
+            for (img_name, img_path), preprocessed in zip(test_images, pending):
                 print(f"  Testing {img_name}...")
-                start_time = time.time()
 
                 try:
-                    # Preprocess
-                    input_tensor = preprocessor.preprocess(str(img_path))
+                    input_tensor = preprocessed.result()
+                    start_time = time.time()
 
                     # Run inference
                     outputs = method.execute((input_tensor,))
                     inference_time = (time.time() - start_time) * 1000
 
                     # Get predictions
-                    logits = torch.from_numpy(np.array(outputs[0]))
-                    probs = torch.nn.functional.softmax(logits.flatten(), dim=-1)
-                    top5_prob, top5_idx = torch.topk(probs, 5)
-
-                    # Format results
-                    predictions = []
-                    for i in range(5):
-                        class_idx = top5_idx[i].item()
-                        confidence = top5_prob[i].item()
-                        class_name = self.imagenet_labels[class_idx] if class_idx < len(self.imagenet_labels) else f"Class {class_idx}"
-
-                        predictions.append({
-                            'rank': i + 1,
-                            'class': class_name,
-                            'class_index': int(class_idx),
+                    # View the runtime's output tensor without copying it
+                    logits = np.asarray(outputs[0], dtype=np.float32).ravel()
+
+                    # Top-5 by partial selection, softmax evaluated only for those five
+                    top5_idx = np.argpartition(logits, -5)[-5:]
+                    top5_idx = top5_idx[np.argsort(logits[top5_idx])[::-1]]
+                    max_logit = logits.max()
+                    denom = np.exp(logits - max_logit).sum()
+                    top5_prob = np.exp(logits[top5_idx] - max_logit) / denom
+
+                    # Format results (tolist() converts all five NumPy scalars in one call)
+                    labels = self.imagenet_labels
+                    predictions = [
+                        {
+                            'rank': rank,
+                            'class': _class_name(labels, class_idx),
+                            'class_index': class_idx,
                             'confidence': round(confidence, 6),
                             'confidence_percent': f"{confidence * 100:.2f}%"
-                        })
+                        }
+                        for rank, (class_idx, confidence) in enumerate(
+                            zip(top5_idx.tolist(), top5_prob.tolist()), start=1
+                        )
+                    ]
 
                     results['test_results'][img_name] = {
                         'status': 'success',
@@ -455,43 +680,46 @@ class ModelValidator:
 
     def validate_detection_model(self, model_path: Path, test_images: List[Tuple[str, Path]]) -> Dict:
         """Validate an object detection model."""
-        print(f"\n{'=' * 70}")
-        print(f"  Testing Object Detection Model: {model_path.name}")
-        print(f"{'=' * 70}\n")
+        print_section(f"Testing Object Detection Model: {model_path.name}")
 
         try:
-            from executorch.runtime import Runtime
-
-            runtime = Runtime.get()
-            program = runtime.load_program(str(model_path))
-            method = program.load_method("forward")
+            method = self._method(model_path, 640)
 
             results = {
                 'model_name': model_path.stem,
                 'model_file': model_path.name,
                 'model_type': 'object_detection',
                 'input_size': 640,
+                'resize_backend': self.resize_backend,
                 'status': 'success',
                 'test_results': {}
             }
 
-            preprocessor = YOLOPreprocessor()
             postprocessor = YOLOPostprocessor(self.coco_labels, conf_threshold=0.25, iou_threshold=0.45)
 
-            for img_name, img_path in test_images:
+            # Letterbox in the background while earlier images run through the model
+            letterbox = partial(YOLOPreprocessor.preprocess_batch, resize_backend=self.resize_backend)
+            pending = self._preprocess_ahead(letterbox, test_images, 640)
+
+            for (img_name, img_path), preprocessed in zip(test_images, pending):
                 print(f"  Testing {img_name}...")
-                start_time = time.time()
 
                 try:
-                    # Preprocess
-                    input_tensor, metadata = preprocessor.preprocess(str(img_path))
+                    input_tensor, (metadata,) = preprocessed.result()
+                    start_time = time.time()
 
                     # Run inference
                     outputs = method.execute((input_tensor,))
                     inference_time = (time.time() - start_time) * 1000
 
                     # Postprocess
-                    output_array = np.array(outputs[0])
+                    # View the output tensor's buffer instead of copying (1x84x8400 floats per image)
+                    if len(outputs) == 1:
+                        output_array = np.asarray(outputs[0])
+                    else:
+                        # *_split_* exports (--yolo-separate-outputs) return boxes [1,4,N] and
+                        # scores [1,nc,N]; rejoin them into the fused [1,4+nc,N] head layout
+                        output_array = np.concatenate([np.asarray(o) for o in outputs[:2]], axis=1)
                     detections = postprocessor.postprocess(output_array, metadata)
 
                     # Format results
@@ -538,6 +766,24 @@ class ModelValidator:
                 'error': str(e)
             }
 
+    def validate_image(self, models: Dict[str, List[Path]], image_path: Path) -> Dict:
+        """Run one image through every model in ``models`` (as returned by find_models)."""
+        test_images = [(image_path.stem, image_path)]
+        result = {
+            'image': str(image_path),
+            'classification_models': [
+                self.validate_classification_model(model_path, test_images)
+                for model_path in models['classification']
+            ],
+            'detection_models': [
+                self.validate_detection_model(model_path, test_images)
+                for model_path in models['detection']
+            ],
+        }
+        # Long-running callers (serve) see a stream of images: don't keep their pixels around
+        self._decoded_images.pop(image_path, None)
+        return result
+
     def validate_all(self) -> Dict:
         """Validate all models with all test images."""
         print("""
@@ -618,12 +864,11 @@ def main():
 
     # Save results
     output_path = Path(output_file)
-    output_path.write_text(json.dumps(results, indent=2))
+    with open(output_path, 'w') as f:
+        json.dump(results, f, indent=2)  # Encodes chunk by chunk, no full string in memory
 
     # Print summary
-    print(f"\n{'=' * 70}")
-    print("  Validation Summary")
-    print(f"{'=' * 70}\n")
+    print_section("Validation Summary")
 
     summary = results['summary']
     print(f"✅ Total Models Tested: {summary['total_models_tested']}")
@@ -633,9 +878,9 @@ def main():
     print(f"❌ Failed: {summary['failed_models']}")
     print(f"\n📸 Test Images: {summary['total_test_images']}")
 
-    print(f"\n{'=' * 70}")
+    print(f"\n{_BAR70}")
     print(f"📄 Results saved to: {output_path}")
-    print(f"{'=' * 70}\n")
+    print(f"{_BAR70}\n")
 
     return 0 if summary['failed_models'] == 0 else 1
 